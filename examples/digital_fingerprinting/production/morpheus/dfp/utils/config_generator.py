@@ -37,7 +37,7 @@ class ConfigGenerator:
         self._encoding = encoding
         self._source_schema_str = pyobj2str(schema.source, encoding=encoding)
         self._preprocess_schema_str = pyobj2str(schema.preprocess, encoding=encoding)
-        self._input_message_type = pyobj2str(MultiMessage, encoding)
+        self._input_message_type = f"{MultiMessage.__module__}.{MultiMessage.__qualname__}"
 
     def get_module_conf(self):
         module_conf = {}
@@ -0,0 +1,71 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#pragma once
+
+#include "morpheus_export.h"
+
+#include "morpheus/objects/dev_mem_info.hpp"  // for DevMemInfo
+#include "morpheus/types.hpp"                 // for RangeType
+
+#include <pybind11/pytypes.h>  // for object
+
+#include <vector>
+
+namespace morpheus {
+/****** Component public implementations *******************/
+/****** DetectionUtil****************************************/
+
+/**
+ * @addtogroup utilities
+ * @{
+ * @file
+ */
+
+/**
+ * @brief Utilities for locating rows which are above a detection threshold.
+ */
+struct MORPHEUS_EXPORT DetectionUtil
+{
+    /**
+     * @brief Returns the `[start, stop)` ranges of contiguous rows in `input` where at least one value in the row is
+     * greater than `threshold`. `input` is expected to be a two dimensional buffer.
+     *
+     * @param input
+     * @param threshold
+     * @return std::vector<RangeType>
+     */
+    static std::vector<RangeType> find_detection_ranges(const DevMemInfo& input, double threshold);
+};
+
+/**
+ * @brief Interface proxy, used to insulate python bindings.
+ */
+struct DetectionUtilInterfaceProxy
+{
+    /**
+     * @brief Python binding for `DetectionUtil::find_detection_ranges` accepting a one or two dimensional cupy array
+     * and returning the ranges as a `(K, 2)` numpy array.
+     *
+     * @param probs
+     * @param threshold
+     * @return pybind11::object
+     */
+    static pybind11::object find_detection_ranges(pybind11::object probs, double threshold);
+};
+/** @} */  // end of group
+}  // namespace morpheus
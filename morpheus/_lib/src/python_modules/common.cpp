@@ -29,6 +29,7 @@
 #include "morpheus/objects/tensor_object.hpp"  // for TensorObject
 #include "morpheus/objects/wrapped_tensor.hpp"
 #include "morpheus/utilities/cudf_util.hpp"
+#include "morpheus/utilities/detection_util.hpp"
 #include "morpheus/version.hpp"
 
 #include <mrc/utils/string_utils.hpp>
@@ -117,6 +118,11 @@ PYBIND11_MODULE(common, _module)
         .value("TENSOR", FilterSource::TENSOR)
         .value("DATAFRAME", FilterSource::DATAFRAME);
 
+    _module.def("find_detection_ranges",
+                &DetectionUtilInterfaceProxy::find_detection_ranges,
+                py::arg("probs"),
+                py::arg("threshold"));
+
     _module.attr("__version__") =
         MRC_CONCAT_STR(morpheus_VERSION_MAJOR << "." << morpheus_VERSION_MINOR << "." << morpheus_VERSION_PATCH);
 }
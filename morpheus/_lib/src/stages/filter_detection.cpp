@@ -33,14 +33,12 @@
 #include "morpheus/objects/table_info.hpp"
 #include "morpheus/objects/tensor_object.hpp"  // for TensorIndex, TensorObject
 #include "morpheus/types.hpp"                  // for RangeType
-#include "morpheus/utilities/matx_util.hpp"
-#include "morpheus/utilities/tensor_util.hpp"  // for TensorUtils::get_element_stride
+#include "morpheus/utilities/detection_util.hpp"  // for DetectionUtil
+#include "morpheus/utilities/tensor_util.hpp"     // for TensorUtils::get_element_stride
 
-#include <cuda_runtime.h>  // for cudaMemcpy, cudaMemcpyDeviceToDevice, cudaMemcpyDeviceToHost
 #include <cudf/column/column_view.hpp>
 #include <cudf/types.hpp>
 #include <glog/logging.h>         // for CHECK, CHECK_NE
-#include <mrc/cuda/common.hpp>    // for MRC_CHECK_CUDA
 #include <rmm/device_buffer.hpp>  // for device_buffer
 
 #include <cstddef>
@@ -120,75 +118,29 @@ FilterDetectionsStage::subscribe_fn_t FilterDetectionsStage::build_operator()
 
         return input.subscribe(rxcpp::make_observer<sink_type_t>(
             [this, &output, &get_filter_source](sink_type_t x) {
-                auto tmp_buffer = get_filter_source(x);
+                auto selected_ranges = DetectionUtil::find_detection_ranges(get_filter_source(x), m_threshold);
 
-                const auto num_rows    = tmp_buffer.shape(0);
-                const auto num_columns = tmp_buffer.shape(1);
-
-                bool by_row = (num_columns > 1);
-
-                // Now call the threshold function
-                auto thresh_bool_buffer = MatxUtil::threshold(tmp_buffer, m_threshold, by_row);
-
-                std::vector<uint8_t> host_bool_values(num_rows);
-
-                // Copy bools back to host
-                MRC_CHECK_CUDA(cudaMemcpy(host_bool_values.data(),
-                                          thresh_bool_buffer->data(),
-                                          thresh_bool_buffer->size(),
-                                          cudaMemcpyDeviceToHost));
-
-                // Only used when m_copy is true
-                std::vector<RangeType> selected_ranges;
-                std::size_t num_selected_rows = 0;
-
-                // We are slicing by rows, using num_rows as our marker for undefined
-                std::size_t slice_start = num_rows;
-                for (std::size_t row = 0; row < num_rows; ++row)
+                if (m_copy)
                 {
-                    bool above_threshold = host_bool_values[row];
-
-                    if (above_threshold && slice_start == num_rows)
+                    TensorIndex num_selected_rows = 0;
+                    for (const auto& [start, stop] : selected_ranges)
                     {
-                        slice_start = row;
+                        num_selected_rows += (stop - start);
                     }
-                    else if (!above_threshold && slice_start != num_rows)
+
+                    // num_selected_rows will be 0 when none of the rows matched the threshold
+                    if (num_selected_rows > 0)
                     {
-                        if (m_copy)
-                        {
-                            selected_ranges.emplace_back(std::pair{slice_start, row});
-                            num_selected_rows += (row - slice_start);
-                        }
-                        else
-                        {
-                            output.on_next(x->get_slice(slice_start, row));
-                        }
-
-                        slice_start = num_rows;
+                        output.on_next(x->copy_ranges(selected_ranges, num_selected_rows));
                     }
                 }
-
-                if (slice_start != num_rows)
+                else
                 {
-                    // Last row was above the threshold
-                    if (m_copy)
-                    {
-                        selected_ranges.emplace_back(std::pair{slice_start, num_rows});
-                        num_selected_rows += (num_rows - slice_start);
-                    }
-                    else
+                    for (const auto& [start, stop] : selected_ranges)
                     {
-                        output.on_next(x->get_slice(slice_start, num_rows));
+                        output.on_next(x->get_slice(start, stop));
                     }
                 }
-
-                // num_selected_rows will always be 0 when m_copy is false,
-                // or when m_copy is true, but none of the rows matched the output
-                if (num_selected_rows > 0)
-                {
-                    DCHECK(m_copy);
-                    output.on_next(x->copy_ranges(selected_ranges, num_selected_rows));
-                }
             },
             [&](std::exception_ptr error_ptr) { output.on_error(error_ptr); },
             [&]() { output.on_completed(); }));
@@ -0,0 +1,152 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "morpheus/utilities/detection_util.hpp"
+
+#include "morpheus/objects/dtype.hpp"              // for DType
+#include "morpheus/objects/memory_descriptor.hpp"  // for MemoryDescriptor
+#include "morpheus/utilities/matx_util.hpp"
+#include "morpheus/utilities/tensor_util.hpp"  // for TensorUtils
+
+#include <cuda_runtime.h>  // for cudaMemcpy, cudaMemcpyDeviceToHost
+#include <glog/logging.h>  // for CHECK
+#include <mrc/cuda/common.hpp>  // for MRC_CHECK_CUDA
+#include <pybind11/gil.h>
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+#include <pybind11/stl.h>  // IWYU pragma: keep
+#include <rmm/cuda_stream_view.hpp>
+#include <rmm/device_buffer.hpp>  // for device_buffer
+
+#include <cstddef>   // for size_t
+#include <cstdint>   // for uint8_t, uintptr_t
+#include <memory>    // for make_shared
+#include <string>
+#include <utility>  // for move, pair
+
+namespace morpheus {
+
+std::vector<RangeType> DetectionUtil::find_detection_ranges(const DevMemInfo& input, double threshold)
+{
+    const auto num_rows    = input.shape(0);
+    const auto num_columns = input.shape(1);
+
+    // The element-wise threshold writes its output with the stride of the input, a single strided column is instead
+    // reduced by row which always produces a contiguous output
+    const bool by_row = (num_columns > 1 || input.stride(0) != 1);
+
+    // Now call the threshold function
+    auto thresh_bool_buffer = MatxUtil::threshold(input, threshold, by_row);
+
+    std::vector<uint8_t> host_bool_values(num_rows);
+
+    // Copy bools back to host
+    MRC_CHECK_CUDA(cudaMemcpy(
+        host_bool_values.data(), thresh_bool_buffer->data(), thresh_bool_buffer->size(), cudaMemcpyDeviceToHost));
+
+    std::vector<RangeType> ranges;
+
+    // We are slicing by rows, using num_rows as our marker for undefined
+    TensorIndex slice_start = num_rows;
+    for (TensorIndex row = 0; row < num_rows; ++row)
+    {
+        bool above_threshold = host_bool_values[row];
+
+        if (above_threshold && slice_start == num_rows)
+        {
+            slice_start = row;
+        }
+        else if (!above_threshold && slice_start != num_rows)
+        {
+            ranges.emplace_back(slice_start, row);
+            slice_start = num_rows;
+        }
+    }
+
+    if (slice_start != num_rows)
+    {
+        // Last row was above the threshold
+        ranges.emplace_back(slice_start, num_rows);
+    }
+
+    return ranges;
+}
+
+pybind11::object DetectionUtilInterfaceProxy::find_detection_ranges(pybind11::object probs, double threshold)
+{
+    // Read the array directly from its interface rather than copying it into a Tensor
+    pybind11::dict arr_interface = probs.attr("__cuda_array_interface__");
+
+    auto shape = arr_interface["shape"].cast<ShapeType>();
+    CHECK(shape.size() > 0 && shape.size() <= 2) << "find_detection_ranges only supports one and two dimensional arrays";
+
+    auto dtype = DType::from_numpy(arr_interface["typestr"].cast<std::string>());
+
+    pybind11::tuple data_tup = arr_interface["data"];
+    auto* data               = reinterpret_cast<void*>(data_tup[0].cast<uintptr_t>());
+
+    ShapeType stride;
+    if (arr_interface.contains("strides") && !arr_interface["strides"].is_none())
+    {
+        // The array interface gives strides in bytes
+        for (auto byte_stride : arr_interface["strides"].cast<ShapeType>())
+        {
+            stride.push_back(byte_stride / static_cast<TensorIndex>(dtype.item_size()));
+        }
+    }
+    else
+    {
+        TensorUtils::set_contiguous_stride(shape, stride);
+    }
+
+    if (shape.size() == 1)
+    {
+        // Treat a one dimensional array as a single column
+        shape.push_back(1);
+        stride.push_back(0);
+    }
+
+    // See https://numba.readthedocs.io/en/latest/cuda/cuda_array_interface.html#synchronization, producers of
+    // versions prior to 3 of the interface don't include the stream
+    if (arr_interface.contains("stream") && !arr_interface["stream"].is_none())
+    {
+        auto stream_value = arr_interface["stream"].cast<intptr_t>();
+        rmm::cuda_stream_view(reinterpret_cast<cudaStream_t>(stream_value)).synchronize();
+    }
+
+    std::vector<RangeType> ranges;
+    {
+        // Need to drop the GIL before calling any methods on the C++ object
+        pybind11::gil_scoped_release no_gil;
+
+        ranges = DetectionUtil::find_detection_ranges(
+            DevMemInfo{data, std::move(dtype), std::make_shared<MemoryDescriptor>(), shape, stride}, threshold);
+    }
+
+    pybind11::array_t<TensorIndex> output({static_cast<pybind11::ssize_t>(ranges.size()), pybind11::ssize_t{2}});
+    auto output_view = output.mutable_unchecked<2>();
+
+    for (std::size_t i = 0; i < ranges.size(); ++i)
+    {
+        output_view(i, 0) = ranges[i].first;
+        output_view(i, 1) = ranges[i].second;
+    }
+
+    return std::move(output);
+}
+
+}  // namespace morpheus
@@ -0,0 +1,102 @@
+/*
+ * SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ * http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+#include "./test_morpheus.hpp"  // IWYU pragma: associated
+
+#include "morpheus/objects/dev_mem_info.hpp"
+#include "morpheus/objects/dtype.hpp"
+#include "morpheus/types.hpp"  // for RangeType, TensorIndex
+#include "morpheus/utilities/detection_util.hpp"
+
+#include <cuda_runtime.h>  // for cudaMemcpy, cudaMemcpyHostToDevice
+#include <gtest/gtest.h>
+#include <mrc/cuda/common.hpp>       // for MRC_CHECK_CUDA
+#include <rmm/cuda_stream_view.hpp>  // for cuda_stream_per_thread
+#include <rmm/device_buffer.hpp>
+
+#include <memory>  // for make_shared
+#include <vector>
+
+using namespace morpheus;
+
+TEST_CLASS(DetectionUtil);
+
+TEST_F(TestDetectionUtil, FindDetectionRanges)
+{
+    std::vector<float> input{0.9, 0.1, 0.2, 0.7, 0.8, 0.1, 0.6};
+    std::vector<RangeType> expected_ranges{{0, 1}, {3, 5}, {6, 7}};
+
+    DType dtype(TypeId::FLOAT32);
+
+    auto input_buffer =
+        std::make_shared<rmm::device_buffer>(input.size() * dtype.item_size(), rmm::cuda_stream_per_thread);
+
+    MRC_CHECK_CUDA(cudaMemcpy(input_buffer->data(), input.data(), input_buffer->size(), cudaMemcpyHostToDevice));
+
+    DevMemInfo dm{input_buffer, dtype, {static_cast<TensorIndex>(input.size()), 1}, {1, 0}};
+
+    EXPECT_EQ(DetectionUtil::find_detection_ranges(dm, 0.5), expected_ranges);
+}
+
+TEST_F(TestDetectionUtil, FindDetectionRangesByRow)
+{
+    // clang-format off
+    // disabling clang-format to illustrate row-major layout
+
+    std::vector<float> input
+    {
+        0.1, 0.2, 0.3,
+        0.1, 0.9, 0.3,
+        0.8, 0.2, 0.3,
+        0.1, 0.2, 0.3,
+        0.1, 0.2, 0.6
+    };
+
+    std::vector<RangeType> expected_ranges{{1, 3}, {4, 5}};
+    // clang-format on
+
+    TensorIndex num_cols = 3;
+    TensorIndex num_rows = 5;
+    EXPECT_EQ(num_cols * num_rows, input.size());
+
+    DType dtype(TypeId::FLOAT32);
+
+    auto input_buffer =
+        std::make_shared<rmm::device_buffer>(input.size() * dtype.item_size(), rmm::cuda_stream_per_thread);
+
+    MRC_CHECK_CUDA(cudaMemcpy(input_buffer->data(), input.data(), input_buffer->size(), cudaMemcpyHostToDevice));
+
+    DevMemInfo dm{input_buffer, dtype, {num_rows, num_cols}, {num_cols, 1}};
+
+    EXPECT_EQ(DetectionUtil::find_detection_ranges(dm, 0.5), expected_ranges);
+}
+
+TEST_F(TestDetectionUtil, FindDetectionRangesNone)
+{
+    std::vector<float> input{0.1, 0.2, 0.3};
+
+    DType dtype(TypeId::FLOAT32);
+
+    auto input_buffer =
+        std::make_shared<rmm::device_buffer>(input.size() * dtype.item_size(), rmm::cuda_stream_per_thread);
+
+    MRC_CHECK_CUDA(cudaMemcpy(input_buffer->data(), input.data(), input_buffer->size(), cudaMemcpyHostToDevice));
+
+    DevMemInfo dm{input_buffer, dtype, {static_cast<TensorIndex>(input.size()), 1}, {1, 0}};
+
+    EXPECT_TRUE(DetectionUtil::find_detection_ranges(dm, 0.5).empty());
+}
@@ -21,6 +21,7 @@ from morpheus._lib.common import FilterSource
 from morpheus._lib.common import Tensor
 from morpheus._lib.common import TypeId
 from morpheus._lib.common import determine_file_type
+from morpheus._lib.common import find_detection_ranges
 from morpheus._lib.common import read_file_to_df
 from morpheus._lib.common import typeid_to_numpy_str
 from morpheus._lib.common import write_df_to_file
@@ -30,6 +31,7 @@ __all__ = [
     "FiberQueue",
     "FileTypes",
     "FilterSource",
+    "find_detection_ranges",
     "read_file_to_df",
     "Tensor",
     "typeid_to_numpy_str",
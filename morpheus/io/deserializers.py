@@ -64,8 +64,8 @@ def read_file_to_df(file_name: str,
         A parsed DataFrame.
     """
 
-    # The C++ reader only supports cudf dataframes
-    if (CppConfig.get_should_use_cpp() and df_type == "cudf"):
+    # The C++ reader only supports cudf dataframes read from a file path
+    if (CppConfig.get_should_use_cpp() and df_type == "cudf" and isinstance(file_name, str)):
         df = read_file_to_df_cpp(file_name, file_type)
         if (filter_nulls):
             df = filter_null_data(df)
@@ -12,33 +12,168 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import atexit
 import hashlib
+import io
 import json
 import logging
 import multiprocessing as mp
 import os
 import pickle
+import random
+import time
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from functools import partial
 
 import fsspec
+import fsspec.asyn
 import fsspec.utils
 import pandas as pd
 
 import cudf
 
 from morpheus._lib.common import FileTypes
-from morpheus.cli.utils import str_to_file_type
+from morpheus.io.deserializers import cudf_json_onread_cleanup
 from morpheus.io.deserializers import read_file_to_df
+from morpheus.io.utils import filter_null_data
 from morpheus.messages import ControlMessage
 from morpheus.messages.message_meta import MessageMeta
+from morpheus.utils.column_info import DataFrameInputSchema
+from morpheus.utils.column_info import _normalize_dataframe
 from morpheus.utils.column_info import process_dataframe
+from morpheus.utils.file_utils import get_filesystem_and_paths
 from morpheus.utils.loader_ids import FILE_TO_DF_LOADER
 from morpheus.utils.loader_utils import register_loader
 
 logger = logging.getLogger(__name__)
 
+# Allow libcudf to read the parquet batch cache through KvikIO, landing the bytes directly in device memory with
+# GPUDirect Storage when it is available. These are process-wide settings applied to every libcudf reader and writer
+# when this module is imported, and only take effect if libcudf has not read them yet. Any values already set by the
+# user take precedence
+os.environ.setdefault("LIBCUDF_CUFILE_POLICY", "KVIKIO")
+os.environ.setdefault("KVIKIO_NTHREADS", "8")
+
 dask_cluster = None
+dask_client = None
+
+_file_type_members = {name.lower(): t for (name, t) in FileTypes.__members__.items()}
+
+
+@lru_cache(maxsize=32)
+def _load_schema(schema_str: str, encoding: str):
+    # The same pickled schema is sent with every control message, only deserialize it once
+    return pickle.loads(bytes(schema_str, encoding))
+
+
+_TRANSIENT_S3_ERROR_CODES = {
+    "500", "503", "ExpiredToken", "InternalError", "RequestTimeout", "ServiceUnavailable", "SlowDown"
+}
+
+
+def _is_transient_s3_error(e: Exception) -> bool:
+    try:
+        from botocore.exceptions import ClientError
+    except ModuleNotFoundError:
+        return False
+
+    # s3fs translates the botocore errors into OSError subclasses, keeping the original as the cause
+    for error in (e, e.__cause__):
+        if (isinstance(error, ClientError)):
+            return error.response.get("Error", {}).get("Code") in _TRANSIENT_S3_ERROR_CODES
+
+    return False
+
+
+def _info_to_ukey(info: dict) -> str:
+    # Object stores such as S3 expose an ETag which, along with the size, uniquely identifies the object
+    if ("ETag" in info):
+        return f"{info['ETag']}-{info.get('size')}"
+
+    return hashlib.sha256(str(info).encode()).hexdigest()
+
+
+def _get_legacy_batch_hash(fs: fsspec.AbstractFileSystem, paths: typing.List[str]) -> str:
+    # Pickled batch caches written by previous releases are named using the hash of a JSON document listing the `ukey`
+    # of each file in the batch
+    hash_data = [{"ukey": fs.ukey(path)} for path in paths]
+
+    return hashlib.md5(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
+
+
+def _get_ukeys(fs: fsspec.AbstractFileSystem, paths: typing.List[str]) -> typing.List[str]:
+    if (not fs.async_impl):
+        return [fs.ukey(path) for path in paths]
+
+    # For async filesystems (i.e. s3fs), request the info for every file concurrently instead of one at a time
+    async def gather_info():
+        return await asyncio.gather(*[fs._info(path) for path in paths])
+
+    return [_info_to_ukey(info) for info in fsspec.asyn.sync(fs.loop, gather_info)]
+
+
+def _project_columns(df: typing.Union[cudf.DataFrame, pd.DataFrame],
+                     input_columns: typing.Optional[typing.List[str]]) -> typing.Union[cudf.DataFrame, pd.DataFrame]:
+    # Drop any columns not used by the schema before processing. This is performed after parsing since the JSON reader
+    # does not support selecting columns and the CSV and Parquet readers fail when a column is missing
+    if (input_columns is None):
+        return df
+
+    return df[[col for col in input_columns if col in df.columns]]
+
+
+def _prepare_file_dataframe(
+        df: typing.Union[cudf.DataFrame, pd.DataFrame],
+        schema: DataFrameInputSchema,
+        input_columns: typing.Optional[typing.List[str]]) -> typing.Union[cudf.DataFrame, pd.DataFrame]:
+    df = _project_columns(df, input_columns)
+
+    # The fields of nested JSON columns can differ between files, normalize them before concatenating so the resulting
+    # columns are lined up by the concat
+    if (schema.json_columns):
+        df = _normalize_dataframe(df, schema)
+
+    return df
+
+
+def _single_object_to_dataframe(path: str,
+                                fs: fsspec.AbstractFileSystem,
+                                file_type: FileTypes,
+                                filter_null: bool,
+                                parser_kwargs: dict,
+                                schema: DataFrameInputSchema,
+                                input_columns: typing.Optional[typing.List[str]],
+                                df_type: typing.Literal["cudf", "pandas"] = "pandas"):
+
+    max_retries = 2
+    s3_df = None
+    for attempt in range(max_retries + 1):
+        try:
+            with fs.open(path, "rb") as f:
+                s3_df = read_file_to_df(f,
+                                        file_type,
+                                        filter_nulls=filter_null,
+                                        df_type=df_type,
+                                        parser_kwargs=parser_kwargs)
+
+            break
+        except Exception as e:
+            # Only retry errors which may succeed on a second attempt, parsing errors are raised immediately
+            if (attempt < max_retries and _is_transient_s3_error(e)):
+                logger.warning("Transient error reading '%s', retrying. Error: %s", path, e)
+                fs.invalidate_cache()
+                time.sleep(0.2 * 2**attempt + random.uniform(0, 0.1))
+            else:
+                raise
+
+    # The remainder of the schema is processed once for the entire batch after concatenating
+    if (s3_df is None):
+        return s3_df
+
+    return _prepare_file_dataframe(s3_df, schema=schema, input_columns=input_columns)
 
 
 def get_dask_cluster(download_method: str):
@@ -53,8 +188,9 @@ def get_dask_cluster(download_method: str):
 
         logger.debug("Dask cluster doesn't exist. Creating dask cluster...")
 
-        # Up the heartbeat interval which can get violated with long download times
-        dask.config.set({"distributed.client.heartbeat": "30s"})
+        # Up the heartbeat interval which can get violated with long download times. Since the client is reused across
+        # batches, also retry connections to the cluster rather than failing on the first dropped connection
+        dask.config.set({"distributed.client.heartbeat": "30s", "distributed.comm.retry.count": 3})
 
         dask_cluster = LocalCluster(start=True, processes=not download_method == "dask_thread")
 
@@ -63,18 +199,35 @@ def get_dask_cluster(download_method: str):
     return dask_cluster
 
 
-def get_dask_client(dask_cluster):
-    from dask.distributed import Client
-    dask_client = Client(get_dask_cluster(dask_cluster))
-    logger.debug("Creating dask client %s ... Done.", dask_client)
+def get_dask_client(download_method: str):
+    global dask_client
+
+    if dask_client is None:
+        from dask.distributed import Client
+
+        dask_client = Client(get_dask_cluster(download_method))
+        logger.debug("Creating dask client %s ... Done.", dask_client)
+
+        atexit.register(close_dask_cluster)
 
     return dask_client
 
 
 def close_dask_cluster():
+    global dask_client
+    global dask_cluster
+
+    if (dask_client is not None):
+        logger.debug("Stopping dask client...")
+        dask_client.close()
+        dask_client = None
+
+        logger.debug("Stopping dask client... Done.")
+
     if (dask_cluster is not None):
         logger.debug("Stopping dask cluster...")
         dask_cluster.close()
+        dask_cluster = None
 
         logger.debug("Stopping dask cluster... Done.")
 
@@ -82,12 +235,19 @@ def close_dask_cluster():
 @register_loader(FILE_TO_DF_LOADER)
 def file_to_df_loader(control_message: ControlMessage, task: dict):
     """
-    This function is used to load files containing data into a dataframe. Dataframe is created by
-    processing files either using a single thread, multiprocess, dask, or dask_thread. This function determines
-    the download method to use, and if it starts with "dask," it creates a dask client and uses it to process the files.
-    Otherwise, it uses a single thread or multiprocess to process the files. This function then caches the resulting
-    dataframe using a hash of the file paths. The dataframe is wrapped in a MessageMeta and then attached as a payload
-    to a ControlMessage object and passed on to further stages.
+    This function is used to load files containing data into a dataframe. Line delimited JSON batches are parsed
+    directly by cuDF in a single call. Other file types, and schemas requiring JSON normalization or a row filter, fall
+    back to processing each file individually either using a single thread, threaded (default), multiprocess, dask,
+    dask_thread or async. In this case the function determines the download method to use, and if it starts with "dask,"
+    it creates a dask client and uses it to process the files. The threaded method uses a thread pool, while the async
+    method downloads the files concurrently using the filesystem's asyncio implementation and parses them in a thread
+    pool. Otherwise, it uses a single thread or multiprocess to process the files. This function then caches the
+    resulting dataframe using a hash of the file paths. The dataframe is wrapped in a MessageMeta and then attached as a
+    payload to a ControlMessage object and passed on to further stages.
+
+    Importing this loader sets the `LIBCUDF_CUFILE_POLICY` environment variable to `KVIKIO` and `KVIKIO_NTHREADS` to
+    `8` unless they are already set. These are process-wide settings used by every libcudf reader and writer, not just
+    the batch cache, and are only read by libcudf once. Set them before starting the process to override them.
 
     Parameters
     ----------
@@ -125,9 +285,14 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
     filter_null = config.get("filter_null", False)
     parser_kwargs = config.get("parser_kwargs", None)
     cache_dir = config.get("cache_dir", None)
+    read_pickle_cache = config.get("read_pickle_cache", False)
 
-    download_method: typing.Literal["single_thread", "multiprocess", "dask",
-                                    "dask_thread"] = os.environ.get("MORPHEUS_FILE_DOWNLOAD_TYPE", "multiprocess")
+    download_method: typing.Literal["single_thread", "threaded", "multiprocess", "dask", "dask_thread",
+                                    "async"] = os.environ.get("MORPHEUS_FILE_DOWNLOAD_TYPE", "threaded")
+
+    # The documented value is "multiprocess", also accept "multiprocessing" which was previously checked for
+    if (download_method == "multiprocessing"):
+        download_method = "multiprocess"
 
     if (cache_dir is None):
         cache_dir = "./.cache"
@@ -136,121 +301,221 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
     cache_dir = os.path.join(cache_dir, "file_cache")
 
     # Load input schema
-    schema = pickle.loads(bytes(schema_str, encoding))
+    schema = _load_schema(schema_str, encoding)
+    input_columns = schema.input_columns
 
     try:
-        file_type = str_to_file_type(file_type.lower())
+        file_type = _file_type_members[file_type.lower()]
     except Exception:
         raise ValueError("Invalid input file type '{}'. Available file types are: CSV, JSON".format(file_type))
 
-    def single_object_to_dataframe(file_object: fsspec.core.OpenFile,
-                                   file_type: FileTypes,
-                                   filter_null: bool,
-                                   parser_kwargs: dict):
-
-        retries = 0
-        s3_df = None
-        while (retries < 2):
-            try:
-                with file_object as f:
-                    s3_df = read_file_to_df(f,
-                                            file_type,
-                                            filter_nulls=filter_null,
-                                            df_type="pandas",
-                                            parser_kwargs=parser_kwargs)
-
-                break
-            except Exception as e:
-                if (retries < 2):
-                    logger.warning("Refreshing S3 credentials")
-                    retries += 1
-                else:
-                    raise e
-
-        # Run the pre-processing before returning
-        if (s3_df is None):
-            return s3_df
-
-        s3_df = process_dataframe(df_in=s3_df, input_schema=schema)
+    process_schema = partial(process_dataframe, input_schema=schema)
+
+    def buffer_to_dataframe(buffer: bytes,
+                            df_type: typing.Literal["cudf", "pandas"]) -> typing.Union[cudf.DataFrame, pd.DataFrame]:
+        s3_df = read_file_to_df(io.BytesIO(buffer),
+                                file_type,
+                                filter_nulls=filter_null,
+                                df_type=df_type,
+                                parser_kwargs=parser_kwargs)
+
+        return _prepare_file_dataframe(s3_df, schema=schema, input_columns=input_columns)
+
+    def download_batch_async(
+            fs: fsspec.AbstractFileSystem,
+            paths: typing.List[str],
+            df_type: typing.Literal["cudf", "pandas"],
+            max_concurrency: int = 64) -> typing.List[typing.Union[cudf.DataFrame, pd.DataFrame]]:
+        if (not fs.async_impl):
+            # Filesystems without an async implementation (i.e. local files) are simply read from a thread pool
+            with ThreadPoolExecutor() as executor:
+                return list(
+                    executor.map(
+                        partial(_single_object_to_dataframe,
+                                fs=fs,
+                                file_type=file_type,
+                                filter_null=filter_null,
+                                parser_kwargs=parser_kwargs,
+                                schema=schema,
+                                input_columns=input_columns,
+                                df_type=df_type),
+                        paths))
+
+        # Line delimited JSON files can simply be joined together, allowing all of the files to be parsed at once
+        join_buffers = file_type == FileTypes.JSON and (parser_kwargs or {}).get("lines", True)
+
+        parse_buffer = partial(buffer_to_dataframe, df_type=df_type)
+
+        async def download_and_parse(executor: ThreadPoolExecutor):
+            semaphore = asyncio.Semaphore(max_concurrency)
+            loop = asyncio.get_running_loop()
+
+            async def download_one(path: str):
+                async with semaphore:
+                    return await fs._cat_file(path)
+
+            async def process_one(path: str):
+                buffer = await download_one(path)
+
+                # Keep parsing off of the event loop so the remaining downloads can proceed
+                return await loop.run_in_executor(executor, parse_buffer, buffer)
+
+            if (join_buffers):
+                buffers = await asyncio.gather(*[download_one(path) for path in paths])
+                buffer = b"\n".join(buffer.rstrip(b"\r\n") for buffer in buffers)
+
+                return [await loop.run_in_executor(executor, parse_buffer, buffer)]
+
+            return await asyncio.gather(*[process_one(path) for path in paths])
+
+        # The coroutines must run on the loop owned by the filesystem (i.e. the aiobotocore session for s3fs)
+        with ThreadPoolExecutor() as executor:
+            return fsspec.asyn.sync(fs.loop, download_and_parse, executor)
+
+    def can_read_batch_with_cudf() -> bool:
+        # cuDF only reads multiple files in a single call for line delimited JSON, CSV files and JSON documents are
+        # parsed individually. JSON normalization and user supplied row filters are written against pandas, for those
+        # schemas we also fall back to parsing and processing each file individually
+        if (file_type != FileTypes.JSON or not (parser_kwargs or {}).get("lines", True)):
+            return False
+
+        return not schema.json_columns and schema.row_filter is None
+
+    def read_batch_to_cudf(file_names: typing.List[str]) -> cudf.DataFrame:
+        kwargs = {"lines": True}
+
+        # Update with any args set by the user. User values overwrite defaults
+        if (parser_kwargs is not None):
+            kwargs.update(parser_kwargs)
+
+        # cuDF accepts the entire list of files, parsing them all on the GPU in a single call
+        df = cudf_json_onread_cleanup(cudf.read_json(file_names, **kwargs))
+
+        if (filter_null):
+            df = filter_null_data(df)
+
+        return process_schema(df_in=_project_columns(df, input_columns))
+
+    def read_batch_per_file(fs: fsspec.AbstractFileSystem,
+                            paths: typing.List[str]) -> typing.Union[cudf.DataFrame, None]:
+        # Files parsed in worker processes are returned as pandas to avoid creating a CUDA context in each worker.
+        # Nested JSON is also parsed with pandas, cuDF would read it into struct columns which are only converted back
+        # to pandas for the normalization. All other files are parsed with cuDF
+        if (download_method in ("dask", "multiprocess") or schema.json_columns):
+            df_type = "pandas"
+        else:
+            df_type = "cudf"
+
+        # The worker is a module level function so it can be pickled when sent to the processes of the pool
+        download_method_func = partial(_single_object_to_dataframe,
+                                       fs=fs,
+                                       file_type=file_type,
+                                       filter_null=filter_null,
+                                       parser_kwargs=parser_kwargs,
+                                       schema=schema,
+                                       input_columns=input_columns,
+                                       df_type=df_type)
+
+        download_buckets = paths
 
-        return s3_df
+        # Loop over dataframes and concat into one
+        dfs = []
+        if (download_method.startswith("dask")):
+            # The client is created once and reused for every batch
+            client = get_dask_client(download_method)
+
+            dfs = client.map(download_method_func, download_buckets)
+            dfs = client.gather(dfs)
+
+        elif (download_method == "async"):
+            dfs = download_batch_async(fs, download_buckets, df_type)
+
+        elif (download_method == "threaded"):
+            # Downloads are I/O bound and the cuDF parsers release the GIL, so threads avoid the cost of spawning
+            # processes while still downloading and parsing in parallel
+            with ThreadPoolExecutor(max_workers=min(32, mp.cpu_count() * 2)) as executor:
+                dfs = list(executor.map(download_method_func, download_buckets))
+
+        elif (download_method == "multiprocess"):
+            # Use multiprocessing here since parallel downloads are a pain
+            with mp.get_context("spawn").Pool(mp.cpu_count()) as p:
+                dfs = p.map(download_method_func, download_buckets)
+        else:
+            # Simply loop
+            for s3_object in download_buckets:
+                dfs.append(download_method_func(s3_object))
+
+        dfs = [df for df in dfs if df is not None]
+
+        if (not dfs):
+            return None
+
+        # Process the schema once on the concatenated frame rather than once per file
+        if (df_type == "pandas"):
+            return cudf.from_pandas(process_schema(df_in=pd.concat(dfs, ignore_index=True)))
+
+        return process_schema(df_in=cudf.concat(dfs, ignore_index=True))
 
     def get_or_create_dataframe_from_s3_batch(file_name_batch: typing.List[str]) -> typing.Tuple[cudf.DataFrame, bool]:
 
         if (not file_name_batch):
             return None, False
 
-        file_list = fsspec.open_files(file_name_batch)
+        fs, paths = get_filesystem_and_paths(file_name_batch)
         # batch_count = file_name_batch[1]
 
-        fs: fsspec.AbstractFileSystem = file_list.fs
-
-        # Create a list of dictionaries that only contains the information we are interested in hashing. `ukey` just
-        # hashes all the output of `info()` which is perfect
-        hash_data = [{"ukey": fs.ukey(file_object.path)} for file_object in file_list]
+        # Hash the `ukey` of each file, `ukey` just hashes all the output of `info()` which is perfect. Feed them into
+        # the digest directly rather than building an intermediate JSON document for the whole batch
+        objects_hash = hashlib.md5()
+        for ukey in sorted(_get_ukeys(fs, paths)):
+            objects_hash.update(ukey.encode() if isinstance(ukey, str) else ukey)
+            objects_hash.update(b"\0")
 
-        # Convert to base 64 encoding to remove - values
-        objects_hash_hex = hashlib.md5(json.dumps(hash_data, sort_keys=True).encode()).hexdigest()
+        objects_hash_hex = objects_hash.hexdigest()
 
-        batch_cache_location = os.path.join(cache_dir, "batches", f"{objects_hash_hex}.pkl")
+        batch_cache_location = os.path.join(cache_dir, "batches", f"{objects_hash_hex}.parquet")
 
         # Return the cache if it exists
         if (os.path.exists(batch_cache_location)):
-            output_df = pd.read_pickle(batch_cache_location)
+            output_df = cudf.read_parquet(batch_cache_location)
             output_df["origin_hash"] = objects_hash_hex
             # output_df["batch_count"] = batch_count
 
             return (output_df, True)
 
-        # Cache miss
-        download_method_func = partial(single_object_to_dataframe,
-                                       file_type=file_type,
-                                       filter_null=filter_null,
-                                       parser_kwargs=parser_kwargs)
+        # TODO: Remove support for reading pickled batch caches in the next release
+        if (read_pickle_cache):
+            legacy_cache_location = os.path.join(cache_dir, "batches", f"{_get_legacy_batch_hash(fs, paths)}.pkl")
 
-        download_buckets = file_list
+            if (os.path.exists(legacy_cache_location)):
+                output_df = cudf.from_pandas(pd.read_pickle(legacy_cache_location))
+                output_df["origin_hash"] = objects_hash_hex
 
-        # Loop over dataframes and concat into one
+                return (output_df, True)
+
+        # Cache miss
         try:
-            dfs = []
-            if (download_method.startswith("dask")):
-                # Create the client each time to ensure all connections to the cluster are
-                # closed (they can time out)
-                dask_cluster = get_dask_cluster(download_method)
-                with get_dask_client(dask_cluster) as client:
-                    dfs = client.map(download_method_func, download_buckets)
-
-                    dfs = client.gather(dfs)
-
-            elif (download_method == "multiprocessing"):
-                # Use multiprocessing here since parallel downloads are a pain
-                with mp.get_context("spawn").Pool(mp.cpu_count()) as p:
-                    dfs = p.map(download_method_func, download_buckets)
+            if (can_read_batch_with_cudf()):
+                output_df = read_batch_to_cudf(file_name_batch)
             else:
-                # Simply loop
-                for s3_object in download_buckets:
-                    dfs.append(download_method_func(s3_object))
+                output_df = read_batch_per_file(fs, paths)
 
         except Exception:
             logger.exception("Failed to download logs. Error: ", exc_info=True)
             return None, False
 
-        if (not dfs):
+        if (output_df is None):
             logger.error("No logs were downloaded")
             return None, False
 
-        output_df: pd.DataFrame = pd.concat(dfs)
-
         # Finally sort by timestamp and then reset the index
-        output_df.sort_values(by=[timestamp_column_name], inplace=True)
-
-        output_df.reset_index(drop=True, inplace=True)
+        output_df = output_df.sort_values(by=[timestamp_column_name]).reset_index(drop=True)
 
         # Save dataframe to cache future runs
         os.makedirs(os.path.dirname(batch_cache_location), exist_ok=True)
 
         try:
-            output_df.to_pickle(batch_cache_location)
+            output_df.to_parquet(batch_cache_location, compression="ZSTD")
         except Exception:
             logger.warning("Failed to save batch cache. Skipping cache for this batch.", exc_info=True)
 
@@ -279,15 +544,16 @@ def file_to_df_loader(control_message: ControlMessage, task: dict):
             logger.exception("Error while converting S3 buckets to DF.")
             raise
 
-    pdf = convert_to_dataframe(files)
+    df = convert_to_dataframe(files)
 
-    df = cudf.from_pandas(pdf)
     payload = control_message.payload()
     if (payload is None):
         control_message.payload(MessageMeta(df))
     else:
+        # The lock is only needed while reading the existing rows, the payload is replaced with a new MessageMeta
         with payload.mutable_dataframe() as dfm:
-            dfm = cudf.concat([dfm, df], ignore_index=True)
-            control_message.payload(MessageMeta(dfm))
+            merged_df = cudf.concat([dfm, df], ignore_index=True)
+
+        control_message.payload(MessageMeta(merged_df))
 
     return control_message
@@ -306,16 +306,22 @@ class MultiMessage(MessageData, cpp_class=_messages.MultiMessage):
 
     def _ranges_to_mask(self, df, ranges):
         if isinstance(df, cudf.DataFrame):
-            zeros_fn = cp.zeros
+            array_mod = cp
         else:
-            zeros_fn = np.zeros
+            array_mod = np
 
-        mask = zeros_fn(len(df), bool)
+            if isinstance(ranges, cp.ndarray):
+                ranges = ranges.get()
 
-        for range in ranges:
-            mask[range[0]:range[1]] = True
+        num_rows = len(df)
 
-        return mask
+        # Build the mask without a per-range loop (which would sync on every element of a device array). Each range
+        # adds one at its start and subtracts one at its stop, the running total is non-zero inside of any range.
+        ranges = array_mod.clip(array_mod.asarray(ranges, dtype=array_mod.int64).reshape((-1, 2)), 0, num_rows)
+        range_delta = (array_mod.bincount(ranges[:, 0], minlength=num_rows + 1) -
+                       array_mod.bincount(ranges[:, 1], minlength=num_rows + 1))
+
+        return array_mod.cumsum(range_delta[:num_rows]) > 0
 
     def copy_meta_ranges(self,
                          ranges: typing.List[typing.Tuple[int, int]],
@@ -330,8 +336,8 @@ class MultiMessage(MessageData, cpp_class=_messages.MultiMessage):
             The `stop_row` isn't included. For example to copy rows 1-2 & 5-7 `ranges=[(1, 3), (5, 8)]`
 
         mask : typing.Union[None, cupy.ndarray, numpy.ndarray]
-            Optionally specify rows as a cupy array (when using cudf Dataframes) or a numpy array (when using pandas
-            Dataframes) of booleans. When not-None `ranges` will be ignored. This is useful as an optimization as this
+            Optionally specify rows as a cupy or numpy array of booleans, a cupy array is copied to the host when using
+            pandas Dataframes. When not-None `ranges` will be ignored. This is useful as an optimization as this
             avoids needing to generate the mask on it's own.
 
         Returns
@@ -342,6 +348,9 @@ class MultiMessage(MessageData, cpp_class=_messages.MultiMessage):
 
         if mask is None:
             mask = self._ranges_to_mask(df, ranges=ranges)
+        elif isinstance(mask, cp.ndarray) and not isinstance(df, cudf.DataFrame):
+            # Masks computed from tensors are always on the device, pandas needs them on the host
+            mask = mask.get()
 
         return df.loc[mask, :]
 
@@ -363,6 +372,24 @@ class MultiMessage(MessageData, cpp_class=_messages.MultiMessage):
 
         return self.from_message(self, meta=MessageMeta(sliced_rows), mess_offset=0, mess_count=len(sliced_rows))
 
+    def copy_rows(self, mask: typing.Union[cp.ndarray, np.ndarray]):
+        """
+        Perform a copy of the current message instance for the rows selected by a boolean `mask`. This avoids the need
+        to convert a mask into `ranges` only to have `copy_ranges` expand them back into a mask.
+
+        Parameters
+        ----------
+        mask : typing.Union[cupy.ndarray, numpy.ndarray]
+            Array of booleans with one entry per row in the message, either a cupy or a numpy array.
+
+        Returns
+        -------
+        `MultiMessage`
+        """
+        sliced_rows = self.copy_meta_ranges(None, mask=mask)
+
+        return self.from_message(self, meta=MessageMeta(sliced_rows), mess_offset=0, mess_count=len(sliced_rows))
+
     @classmethod
     def from_message(cls: typing.Type[Self],
                      message: "MultiMessage",
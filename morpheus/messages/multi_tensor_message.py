@@ -271,10 +271,24 @@ class MultiTensorMessage(MultiMessage, cpp_class=_messages.MultiTensorMessage):
         -------
         `MultiTensorMessage`
         """
-        mask = self._ranges_to_mask(self.get_meta(), ranges)
-        sliced_rows = self.copy_meta_ranges(ranges, mask=mask)
+        return self.copy_rows(self._ranges_to_mask(self.get_meta(), ranges))
+
+    def copy_rows(self, mask):
+        """
+        Perform a copy of the current message, dataframe and tensors for the rows selected by a boolean `mask`.
+
+        Parameters
+        ----------
+        mask : typing.Union[cupy.ndarray, numpy.ndarray]
+            Array of booleans with one entry per row in the message, either a cupy or a numpy array.
+
+        Returns
+        -------
+        `MultiTensorMessage`
+        """
+        sliced_rows = self.copy_meta_ranges(None, mask=mask)
         sliced_count = len(sliced_rows)
-        sliced_tensors = self.copy_tensor_ranges(ranges, mask=mask)
+        sliced_tensors = self.copy_tensor_ranges(None, mask=mask)
 
         mem = TensorMemory(count=sliced_count, tensors=sliced_tensors)
 
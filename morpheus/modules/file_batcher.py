@@ -15,17 +15,18 @@
 import datetime
 import logging
 import re
-from collections import namedtuple
+import typing
 
 import fsspec
 import fsspec.utils
 import mrc
+import pandas as pd
 from mrc.core import operators as ops
 
 import cudf
 
 from morpheus.messages import ControlMessage
-from morpheus.utils.file_utils import date_extractor
+from morpheus.utils.file_utils import get_filesystem_and_paths
 from morpheus.utils.loader_ids import FILE_TO_DF_LOADER
 from morpheus.utils.module_ids import FILE_BATCHER
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
@@ -39,6 +40,32 @@ default_iso_date_regex_pattern = (
     r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
     r"T(?P<hour>\d{1,2})(:|_)(?P<minute>\d{1,2})(:|_)(?P<second>\d{1,2})(?P<microsecond>\.\d{1,6})?Z")
 
+# Values of the date parts which are not captured by the ISO date regex pattern, the year is always required
+_DATE_PART_DEFAULTS = {"month": 1, "day": 1, "hour": 0, "minute": 0, "second": 0}
+
+# Fixed length periods can be bucketed with an integer division of the timestamps, avoiding the string formatting
+# performed by `to_period_cudf_approximation`
+_PERIOD_TO_NS = {
+    "s": 1000000000,
+    "S": 1000000000,
+    "T": 60 * 1000000000,
+    "min": 60 * 1000000000,
+    "H": 3600 * 1000000000,
+    "d": 86400 * 1000000000,
+    "D": 86400 * 1000000000,
+}
+
+
+def _get_fixed_period_ns(period: str) -> typing.Optional[int]:
+    match = re.fullmatch(r"(\d*)(\w+)", period)
+
+    if (match is None or match.group(2) not in _PERIOD_TO_NS):
+        return None
+
+    count = int(match.group(1)) if match.group(1) else 1
+
+    return count * _PERIOD_TO_NS[match.group(2)]
+
 
 @register_module(FILE_BATCHER, MORPHEUS_MODULE_NAMESPACE)
 def file_batcher(builder: mrc.Builder):
@@ -59,6 +86,8 @@ def file_batcher(builder: mrc.Builder):
             - cache_dir (str): Cache directory; Example: `./file_batcher_cache`; Default: None
             - file_type (str): File type; Example: JSON; Default: JSON
             - filter_nulls (bool): Whether to filter null values; Example: false; Default: false
+            - read_pickle_cache (bool): Whether to read batch caches pickled by previous releases; Example: true;
+            Default: false
             - schema (dict): Data schema; See below; Default: `[Required]`
             - timestamp_column_name (str): Name of the timestamp column; Example: timestamp; Default: timestamp
 
@@ -78,11 +107,17 @@ def file_batcher(builder: mrc.Builder):
 
     config = builder.get_current_module_config()
 
-    TimestampFileObj = namedtuple("TimestampFileObj", ["timestamp", "file_name"])
-
     iso_date_regex_pattern = config.get("batch_iso_date_regex_pattern", default_iso_date_regex_pattern)
     iso_date_regex = re.compile(iso_date_regex_pattern)
 
+    # libcudf regex does not support named groups. Strip the names, the group numbering remains identical which allows
+    # us to locate each of the date parts in the output of `str.extract`
+    iso_date_group_index = iso_date_regex.groupindex
+    if ("year" not in iso_date_group_index):
+        raise ValueError(f"The ISO date regex pattern must capture the year, got: {iso_date_regex_pattern}")
+
+    cudf_iso_date_regex_pattern = re.sub(r"\(\?P<\w+>", "(", iso_date_regex_pattern)
+
     default_batching_opts = {
         "period": config.get("period", 'D'),
         "sampling_rate_s": config.get("sampling_rate_s", 0),
@@ -99,8 +134,47 @@ def file_batcher(builder: mrc.Builder):
         if data_type not in {"payload", "streaming"}:
             raise ValueError(f"Invalid 'data_type' metadata in control message: {data_type}")
 
+    def extract_timestamps(fs: fsspec.AbstractFileSystem, paths: typing.List[str]) -> cudf.Series:
+        # Match regex with the pathname since that can be more accurate
+        groups = cudf.Series(paths, dtype="str").str.extract(cudf_iso_date_regex_pattern)
+
+        date_parts = cudf.DataFrame(index=groups.index)
+        date_parts["year"] = groups[iso_date_group_index["year"] - 1].astype("int64")
+
+        for (part, default) in _DATE_PART_DEFAULTS.items():
+            group_index = iso_date_group_index.get(part)
+
+            # Patterns are not required to capture every part of the date, any missing parts default to the start of
+            # the enclosing period
+            if (group_index is None):
+                date_parts[part] = default
+            else:
+                date_parts[part] = groups[group_index - 1].astype("int64")
+
+        if ("microsecond" in iso_date_group_index):
+            microsecond = groups[iso_date_group_index["microsecond"] - 1].astype("float64").fillna(0.0)
+            date_parts["us"] = (microsecond * 1000000).round().astype("int64")
+
+        timestamps = cudf.to_datetime(date_parts)
+
+        if (timestamps.isna().any()):
+            # Otherwise, fallback to the file modified (created?) time for any file not matching the regex
+            timestamps = timestamps.to_pandas()
+
+            for idx in timestamps.index[timestamps.isna()]:
+                modified = pd.Timestamp(fs.modified(paths[idx]))
+
+                if (modified.tzinfo is not None):
+                    modified = modified.tz_convert(None)
+
+                timestamps[idx] = modified
+
+            timestamps = cudf.from_pandas(timestamps)
+
+        return timestamps
+
     def build_fs_filename_df(files, params):
-        file_objects: fsspec.core.OpenFiles = fsspec.open_files(files)
+        fs, paths = get_filesystem_and_paths(files)
 
         try:
             start_time = params["start_time"]
@@ -118,78 +192,71 @@ def file_batcher(builder: mrc.Builder):
             if not isinstance(sampling_rate_s, int) or sampling_rate_s < 0:
                 raise ValueError(f"Invalid 'sampling_rate_s' value: {sampling_rate_s}")
 
+            # Timestamps are compared as timezone naive UTC values on the GPU
             if (start_time is not None):
-                start_time = datetime.datetime.strptime(start_time, '%Y-%m-%d').replace(tzinfo=datetime.timezone.utc)
+                start_time = datetime.datetime.strptime(start_time, '%Y-%m-%d')
 
             if (end_time is not None):
-                end_time = datetime.datetime.strptime(end_time, '%Y-%m-%d').replace(tzinfo=datetime.timezone.utc)
+                end_time = datetime.datetime.strptime(end_time, '%Y-%m-%d')
 
         except Exception as e:
             logger.error(f"Error parsing parameters: {e}")
             raise
 
-        ts_and_files = []
-        for file_object in file_objects:
-            ts = date_extractor(file_object, iso_date_regex)
-
-            # Exclude any files outside the time window
-            if ((start_time is not None and ts < start_time) or (end_time is not None and ts > end_time)):
-                continue
-
-            ts_and_files.append(TimestampFileObj(ts, file_object.full_name))
-
-        # sort the incoming data by date
-        ts_and_files.sort(key=lambda x: x.timestamp)
-
-        if ((len(ts_and_files) > 1) and (sampling_rate_s > 0)):
-            file_sampled_list = []
+        df = cudf.DataFrame()
 
-            ts_last = ts_and_files[0].timestamp
+        if (len(paths) == 0):
+            return df
 
-            file_sampled_list.append(ts_and_files[0])
+        df["ts"] = extract_timestamps(fs, paths)
+        df["key"] = [fs.unstrip_protocol(path) for path in paths]
 
-            for idx in range(1, len(ts_and_files)):
-                ts = ts_and_files[idx].timestamp
+        # Exclude any files outside the time window
+        if (start_time is not None):
+            df = df[df["ts"] >= start_time]
 
-                if ((ts - ts_last).seconds >= sampling_rate_s):
-                    ts_and_files.append(ts_and_files[idx])
-                    ts_last = ts
-            else:
-                ts_and_files = file_sampled_list
+        if (end_time is not None):
+            df = df[df["ts"] <= end_time]
 
-        timestamps = []
-        full_names = []
-        for (ts, file_name) in ts_and_files:
-            timestamps.append(ts)
-            full_names.append(file_name)
+        # sort the incoming data by date
+        df = df.sort_values("ts").reset_index(drop=True)
 
-        df = cudf.DataFrame()
-        df["ts"] = timestamps
-        df["key"] = full_names
+        if ((len(df) > 1) and (sampling_rate_s > 0)):
+            # Keep only the first file within each `sampling_rate_s` window measured from the earliest file
+            elapsed_ns = (df["ts"] - df["ts"].iloc[0]).astype("timedelta64[ns]").astype("int64")
+            df["bucket"] = elapsed_ns // (sampling_rate_s * 1000000000)
+            df = df.drop_duplicates(subset="bucket", keep="first").drop(columns="bucket").reset_index(drop=True)
 
         return df
 
-    def generate_cms_for_batch_periods(control_message: ControlMessage, period_gb, n_groups):
+    def generate_cms_for_batch_periods(control_message: ControlMessage, ts_filenames_df: cudf.DataFrame):
         data_type = control_message.get_metadata("data_type")
 
+        # Collect the files for every period in a single pass, then bring them all back to the host at once
+        period_files = ts_filenames_df.groupby("period", sort=True).agg({"key": "collect"}).reset_index()
+        n_groups = len(period_files)
+
+        # TODO(Devin): Remove this when we're able to attach config to the loader
+        batcher_config = {
+            "timestamp_column_name": config.get("timestamp_column_name"),
+            "schema": config.get("schema"),
+            "file_type": config.get("file_type"),
+            "filter_null": config.get("filter_null"),
+            "parser_kwargs": config.get("parser_kwargs"),
+            "cache_dir": config.get("cache_dir"),
+            "read_pickle_cache": config.get("read_pickle_cache", False)
+        }
+
         control_messages = []
-        for group in period_gb.groups:
-            period_df = period_gb.get_group(group)
-            filenames = period_df["key"].to_arrow().to_pylist()
+        for period in period_files.to_arrow().to_pylist():
+            filenames = period["key"]
 
             load_task = {
                 "loader_id": FILE_TO_DF_LOADER,
                 "strategy": "aggregate",
                 "files": filenames,
                 "n_groups": n_groups,
-                "batcher_config": {  # TODO(Devin): Remove this when we're able to attach config to the loader
-                    "timestamp_column_name": config.get("timestamp_column_name"),
-                    "schema": config.get("schema"),
-                    "file_type": config.get("file_type"),
-                    "filter_null": config.get("filter_null"),
-                    "parser_kwargs": config.get("parser_kwargs"),
-                    "cache_dir": config.get("cache_dir")
-                }
+                "batcher_config": batcher_config
             }
 
             if (data_type == "payload"):
@@ -227,11 +294,15 @@ def file_batcher(builder: mrc.Builder):
             if len(ts_filenames_df) > 0:
                 # Now split by the batching settings
 
-                ts_filenames_df = to_period_cudf_approximation(ts_filenames_df, params["period"])
-                period_gb = ts_filenames_df.groupby("period")
-                n_groups = len(period_gb.groups)
+                period_ns = _get_fixed_period_ns(params["period"])
+
+                if (period_ns is not None):
+                    ts_ns = ts_filenames_df["ts"].astype("datetime64[ns]").astype("int64")
+                    ts_filenames_df["period"] = ts_ns // period_ns
+                else:
+                    ts_filenames_df = to_period_cudf_approximation(ts_filenames_df, params["period"])
 
-                control_messages = generate_cms_for_batch_periods(control_message, period_gb, n_groups)
+                control_messages = generate_cms_for_batch_periods(control_message, ts_filenames_df)
 
             return control_messages
         except Exception as e:
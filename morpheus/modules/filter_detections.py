@@ -13,24 +13,108 @@
 # limitations under the License.
 
 import logging
-import pickle
 import typing
 
 import cupy as cp
 import mrc
+import numba
 import numpy as np
-import typing_utils
 from mrc.core import operators as ops
 
 from morpheus.common import FilterSource
+from morpheus.common import find_detection_ranges
 from morpheus.messages import MultiMessage
-from morpheus.messages.multi_response_message import MultiResponseMessage
+from morpheus.utils.detection_utils import build_detections_fn
+from morpheus.utils.detection_utils import find_edges
+from morpheus.utils.detection_utils import get_column_detections
+from morpheus.utils.detection_utils import resolve_filter_source
+from morpheus.utils.detection_utils import resolve_message_type
 from morpheus.utils.module_ids import FILTER_DETECTIONS
 from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
 from morpheus.utils.module_utils import register_module
 
 logger = logging.getLogger(__name__)
 
+# A uint64 view of eight consecutive `True` values
+_ALL_TRUE_WORD = np.uint64(0x0101010101010101)
+
+
+@numba.njit(cache=True, nogil=True)
+def _find_edges_jit(mask: np.ndarray) -> np.ndarray:
+    """
+    Host implementation of `find_edges` as a single scan over the mask, counting the edges first so that only the
+    output array is allocated.
+    """
+    num_rows = mask.shape[0]
+
+    num_edges = 0
+    previous = False
+    for i in range(num_rows):
+        if (mask[i] != previous):
+            num_edges += 1
+            previous = mask[i]
+
+    if (previous):
+        num_edges += 1
+
+    edges = np.empty(num_edges, dtype=np.int64)
+
+    j = 0
+    previous = False
+    for i in range(num_rows):
+        if (mask[i] != previous):
+            edges[j] = i
+            j += 1
+            previous = mask[i]
+
+    if (previous):
+        edges[j] = num_rows
+
+    return edges
+
+
+def _find_edges_swar(mask: np.ndarray) -> np.ndarray:
+    """
+    Host implementation of `find_edges`. The mask is scanned eight rows at a time as `uint64` words, and only words
+    which are not uniform, or which differ from the last row of the previous word, are scanned row by row. Masks made
+    up of short runs fall back to `_find_edges_jit`.
+    """
+    mask = np.ascontiguousarray(mask, dtype=np.bool_)
+    num_rows = len(mask)
+    num_words = num_rows // 8
+    word_rows = num_words * 8
+
+    if (num_words < 2):
+        return _find_edges_jit(mask)
+
+    words = mask[:word_rows].view(np.uint64)
+
+    # An edge can only fall inside a word which is neither all `False` nor all `True`, or on its first row when that
+    # differs from the last row of the previous word
+    changed = (words != 0) & (words != _ALL_TRUE_WORD)
+    changed[0] |= mask[0]
+    changed[1:] |= mask[8:word_rows:8] != mask[7:word_rows - 8:8]
+
+    candidate_words = np.flatnonzero(changed)
+
+    if (len(candidate_words) > num_words // 4):
+        return _find_edges_jit(mask)
+
+    # Rows to check, all rows of the candidate words followed by the rows in the tail which don't fill a word
+    rows = np.concatenate([(candidate_words[:, np.newaxis] * 8 + np.arange(8)).ravel(), np.arange(word_rows, num_rows)])
+
+    previous = np.zeros(len(rows), dtype=np.bool_)
+    has_previous = rows > 0
+    previous[has_previous] = mask[rows[has_previous] - 1]
+
+    edges = rows[mask[rows] != previous]
+
+    # Closing edge for a run which extends to the last row
+    if (mask[-1]):
+        edges = np.append(edges, num_rows)
+
+    return edges
+
 
 @register_module(FILTER_DETECTIONS, MORPHEUS_MODULE_NAMESPACE)
 def filter_detections(builder: mrc.Builder):
@@ -68,15 +152,19 @@ def filter_detections(builder: mrc.Builder):
     Notes
     -----
         Configurable Parameters:
+            - batch_size (int): Number of messages to filter together in copy mode; Example: 8; Default: 1
             - copy (bool): Whether to copy the rows or slice them; Example: true; Default: true
             - field_name (str): Name of the field to filter on; Example: `probs`; Default: probs
             - filter_source (str): Source of the filter field; Example: `AUTO`; Default: AUTO
+            - quantization_scale (float): Scale of integer tensors holding quantized probabilities; Example: 255;
+            Default: None
             - schema (dict): Schema configuration; See Below; Default: -
             - threshold (float): Threshold value to filter on; Example: 0.5; Default: 0.5
 
         schema:
             - encoding (str): Encoding; Example: "latin1"; Default: "latin1"
-            - input_message_type (str): Pickled message type; Example: `pickle_message_type`; Default: `[Required]`
+            - input_message_type (str): Fully-qualified message type name; Example:
+                `morpheus.messages.MultiMessage`; Default: `[Required]`
             - schema_str (str): Schema string; Example: "string"; Default: `[Required]`
     """
 
@@ -86,39 +174,129 @@ def filter_detections(builder: mrc.Builder):
     threshold = config.get("threshold", 0.5)
     filter_source = config.get("filter_source", "AUTO")
     copy = config.get("copy", True)
+    batch_size = config.get("batch_size", 1)
+    quantization_scale = config.get("quantization_scale", None)
 
     if ("schema" not in config):
         raise ValueError("Schema configuration not found.")
 
     schema_config = config["schema"]
     input_message_type = schema_config["input_message_type"]
-    encoding = schema_config["encoding"]
+    encoding = schema_config.get("encoding", "latin1")
 
-    message_type = pickle.loads(bytes(input_message_type, encoding))
+    message_type = resolve_message_type(input_message_type, encoding)
 
-    def find_detections(multi_message: MultiMessage, _filter_source) -> typing.Union[cp.ndarray, np.ndarray]:
+    filter_source = resolve_filter_source(filter_source, message_type)
 
-        # Determind the filter source
-        if _filter_source == FilterSource.TENSOR:
-            _filter_source = multi_message.get_output(field_name)
-        else:
-            _filter_source = multi_message.get_meta(field_name).values
+    # The filter source is fixed for the lifetime of the module, bind the mask computation once rather than per message
+    if filter_source == FilterSource.TENSOR:
+
+        # Output tensors always live on the device, the filter runs on its own non-blocking stream
+        filter_stream = cp.cuda.Stream(non_blocking=True)
+
+        # Reused between messages and grown geometrically, the mask is only ever read before the next message is
+        # filtered so the same memory can be written each time rather than going back to the memory pool
+        scratch_mask = cp.empty(0, dtype=cp.bool_)
+
+        array_mod = cp
+
+        def compute_detections(probs: cp.ndarray) -> cp.ndarray:
+            nonlocal scratch_mask
+
+            num_rows = probs.shape[0]
+            current_stream = cp.cuda.get_current_stream()
+
+            # Order the filter after the work which produced `probs` (and consumed the previous mask), then have the
+            # current stream wait on the result. Both waits happen on the device so the host is never blocked here.
+            filter_stream.wait_event(current_stream.record())
+
+            with filter_stream:
+                if (scratch_mask.size < num_rows):
+                    scratch_mask = cp.empty(max(num_rows, 2 * scratch_mask.size), dtype=cp.bool_)
+
+                detections = scratch_mask[:num_rows]
+
+                # Specialized for the dimensions and type of the tensor, normally only ever built for the first message
+                build_detections_fn(probs.ndim, probs.dtype, threshold, quantization_scale)(probs, detections)
+
+            current_stream.wait_event(filter_stream.record())
+
+            return detections
+
+        def get_detections(multi_message: MultiMessage) -> cp.ndarray:
+            return compute_detections(multi_message.get_output(field_name))
+
+        def get_batch_detections(messages: typing.List[MultiMessage]) -> typing.List[cp.ndarray]:
+            # Threshold the outputs of every message in the batch together, then split the mask back up per message
+            probs = [multi_message.get_output(field_name) for multi_message in messages]
+            detections = compute_detections(cp.concatenate(probs))
+            offsets = np.cumsum([0] + [len(message_probs) for message_probs in probs]).tolist()
+
+            return [detections[start:stop] for (start, stop) in zip(offsets[:-1], offsets[1:])]
+    else:
+
+        # Resolved from the first message, every message in a pipeline is backed by the same array library
+        array_mod = None
 
-        if (isinstance(_filter_source, np.ndarray)):
-            array_mod = np
+        def get_detections(multi_message: MultiMessage) -> typing.Union[cp.ndarray, np.ndarray]:
+            nonlocal array_mod
+
+            detections = get_column_detections(multi_message, field_name, threshold)
+
+            if (array_mod is None):
+                array_mod = cp.get_array_module(detections)
+
+            return detections
+
+        def get_batch_detections(
+                messages: typing.List[MultiMessage]) -> typing.List[typing.Union[cp.ndarray, np.ndarray]]:
+            # Each column comparison is already a single kernel, there is nothing to gain from concatenating them
+            return [get_detections(multi_message) for multi_message in messages]
+
+    def detections_to_pairs(detections: typing.Union[cp.ndarray, np.ndarray]) -> typing.Union[cp.ndarray, np.ndarray]:
+        if (array_mod is np):
+            edges = _find_edges_swar(detections)
         else:
-            array_mod = cp
+            edges = find_edges(detections)
+
+        return edges.reshape((-1, 2))
 
-        # Get per row detections
-        detections = (_filter_source > threshold)
+    def find_detections(multi_message: MultiMessage) -> typing.Union[cp.ndarray, np.ndarray, None]:
+        if (filter_source == FilterSource.TENSOR):
+            probs = multi_message.get_output(field_name)
 
-        if (len(detections.shape) > 1):
-            detections = detections.any(axis=1)
+            # Single and double precision outputs are thresholded and scanned for ranges in a single call into the C++
+            # library, which returns the pairs already on the host
+            if (probs.dtype in (cp.float32, cp.float64)):
+                true_pairs = find_detection_ranges(probs, threshold)
 
-        # Surround in False to ensure we get an even number of pairs
-        detections = array_mod.concatenate([array_mod.array([False]), detections, array_mod.array([False])])
+                return true_pairs if len(true_pairs) > 0 else None
 
-        return array_mod.where(detections[1:] != detections[:-1])[0].reshape((-1, 2))
+        detections = get_detections(multi_message)
+
+        # Messages without any detections are common, skip finding the edges and return `None` for these
+        if (not detections.any()):
+            return None
+
+        return detections_to_pairs(detections)
+
+    def copy_detections(multi_message: MultiMessage,
+                        detections: typing.Union[cp.ndarray, np.ndarray]) -> typing.Union[MultiMessage, None]:
+        if (not detections.any()):
+            return None
+
+        # Python messages can copy directly from the mask, skipping the conversion to ranges and back
+        if (hasattr(multi_message, "copy_rows")):
+            return multi_message.copy_rows(detections)
+
+        # The C++ messages convert the ranges one element at a time, which for a device array means a transfer per
+        # element. Hand them a host list in a single transfer along with the selected row count.
+        true_pairs = detections_to_pairs(detections)
+
+        if (array_mod is cp):
+            true_pairs = true_pairs.get()
+
+        return multi_message.copy_ranges(true_pairs.tolist(), int((true_pairs[:, 1] - true_pairs[:, 0]).sum()))
 
     def filter_copy(multi_message: MultiMessage) -> typing.Union[MultiMessage, None]:
         """
@@ -138,12 +316,29 @@ def filter_detections(builder: mrc.Builder):
         if multi_message is None:
             return None
 
-        true_pairs = find_detections(multi_message, filter_source)
+        return copy_detections(multi_message, get_detections(multi_message))
 
-        if (true_pairs.shape[0] == 0):
-            return None
+    def filter_copy_batch(messages: typing.List[MultiMessage]) -> typing.List[MultiMessage]:
+        """
+        Batched version of `filter_copy`, thresholding the given messages together.
+
+        Parameters
+        ----------
+        messages : typing.List[`morpheus.pipeline.messages.MultiMessage`]
+            Response messages with probabilities calculated from inference results.
+
+        Returns
+        -------
+        typing.List[`morpheus.pipeline.messages.MultiMessage`]
+            New messages containing a copy of the rows above the threshold, messages without any are dropped.
 
-        return multi_message.copy_ranges(true_pairs)
+        """
+        output_list = [
+            copy_detections(multi_message, detections)
+            for (multi_message, detections) in zip(messages, get_batch_detections(messages))
+        ]
+
+        return [output for output in output_list if output is not None]
 
     def filter_slice(multi_message: MultiMessage) -> typing.List[MultiMessage]:
         """
@@ -162,30 +357,53 @@ def filter_detections(builder: mrc.Builder):
         """
 
         # Unfortunately we have to convert this to a list in case there are non-contiguous groups
-        output_list = []
-        if multi_message is not None:
-            true_pairs = find_detections(multi_message, filter_source)
-            for pair in true_pairs:
-                pair = tuple(pair.tolist())
-                if ((pair[1] - pair[0]) > 0):
-                    output_list.append(multi_message.get_slice(*pair))
-
-        return output_list
-
-    if filter_source == "AUTO":
-        if (typing_utils.issubtype(message_type, MultiResponseMessage)):
-            filter_source = FilterSource.TENSOR
-        else:
-            filter_source = FilterSource.DATAFRAME
+        if multi_message is None:
+            return []
 
-        # logger.debug(f"filter_source was set to Auto, infering a filter source of {filter_source} based on an input "
-        #             "message type of {message_type}")
-    elif filter_source == "DATAFRAME":
-        filter_source = FilterSource.DATAFRAME
-    else:
-        raise Exception("Unknown filter source: {}".format(filter_source))
+        true_pairs = find_detections(multi_message)
+
+        if (true_pairs is None):
+            return []
+
+        # Copy the pairs to the host once rather than syncing on every pair
+        if (isinstance(true_pairs, cp.ndarray)):
+            true_pairs = true_pairs.get()
+
+        true_pairs = true_pairs[true_pairs[:, 1] > true_pairs[:, 0]]
+
+        return [multi_message.get_slice(start, stop) for (start, stop) in true_pairs.tolist()]
+
+    if copy and batch_size > 1:
+        # Accumulate `batch_size` messages and filter them together, amortizing the per-message kernel launches. Any
+        # remaining messages are flushed once the input completes.
+        def batch_fn(obs: mrc.Observable, sub: mrc.Subscriber):
+            pending: typing.List[MultiMessage] = []
+
+            def flush() -> typing.List[MultiMessage]:
+                messages = pending.copy()
+                pending.clear()
+
+                return filter_copy_batch(messages)
+
+            def on_next(multi_message: MultiMessage) -> typing.List[MultiMessage]:
+                if multi_message is not None:
+                    pending.append(multi_message)
+
+                if (len(pending) < batch_size):
+                    return []
+
+                return flush()
+
+            def on_completed():
+                to_send = flush() if len(pending) > 0 else []
+
+                return to_send if len(to_send) > 0 else None
+
+            obs.pipe(ops.map(on_next), ops.filter(lambda x: len(x) > 0), ops.on_completed(on_completed),
+                     ops.flatten()).subscribe(sub)
 
-    if copy:
+        node = builder.make_node_full(FILTER_DETECTIONS, batch_fn)
+    elif copy:
         node = builder.make_node(FILTER_DETECTIONS, filter_copy)
     else:
         # Convert list back to individual messages
@@ -0,0 +1,187 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import re
+import typing
+
+import cupy as cp
+import mrc
+import numpy as np
+import pandas as pd
+
+import cudf
+
+from morpheus.common import FilterSource
+from morpheus.messages import MultiMessage
+from morpheus.messages.message_meta import MessageMeta
+from morpheus.modules.serialize import select_columns
+from morpheus.utils.detection_utils import build_detections_fn
+from morpheus.utils.detection_utils import get_column_detections
+from morpheus.utils.detection_utils import resolve_filter_source
+from morpheus.utils.detection_utils import resolve_message_type
+from morpheus.utils.module_ids import FUSED_FILTER_SERIALIZE
+from morpheus.utils.module_ids import MORPHEUS_MODULE_NAMESPACE
+from morpheus.utils.module_utils import register_module
+
+logger = logging.getLogger(__name__)
+
+
+@register_module(FUSED_FILTER_SERIALIZE, MORPHEUS_MODULE_NAMESPACE)
+def fused_filter_serialize(builder: mrc.Builder):
+    """
+    Filter messages by a classification threshold and serialize the selected columns in a single node.
+
+    This is equivalent to the `FilterDetections` module in copy mode followed directly by the `Serialize` module. Rather
+    than copying the matching rows into an intermediate `MultiMessage` which is then passed to the next node, the mask
+    is applied to the selected columns directly, emitting a `MessageMeta` for each incoming message with detections.
+
+    Parameters
+    ----------
+    builder : mrc.Builder
+        An mrc Builder object.
+
+    Notes
+    -----
+        Configurable Parameters:
+            - filter_detections (dict): Filter configuration, as for the `FilterDetections` module. The `copy` and
+            `batch_size` options are ignored; See Below; Default: `[Required]`
+            - serialize (dict): Serialize configuration, as for the `Serialize` module; See Below; Default: {}
+
+        filter_detections:
+            - field_name (str): Name of the field to filter on; Example: `probs`; Default: probs
+            - filter_source (str): Source of the filter field; Example: `AUTO`; Default: AUTO
+            - quantization_scale (float): Scale of integer tensors holding quantized probabilities; Example: 255;
+            Default: None
+            - schema (dict): Schema configuration, as for the `FilterDetections` module; Default: `[Required]`
+            - threshold (float): Threshold value to filter on; Example: 0.5; Default: 0.5
+
+        serialize:
+            - columns (list[string]): List of columns to include; Example: `["column1", "column2", "column3"]`;
+            Default: None
+            - exclude (list[string]): List of regex patterns to exclude columns; Example: `["column_to_exclude"]`;
+            Default: `[r'^ID$', r'^_ts_']`
+            - fixed_columns (bool): If true, the columns are fixed and not determined at runtime; Example: `true`;
+            Default: true
+            - include (string): Regex to include columns; Example: `^column`; Default: None
+            - use_cpp (bool): If true, emit a cudf DataFrame for pandas input; Example: `true`; Default: false
+    """
+
+    config = builder.get_current_module_config()
+
+    if ("filter_detections" not in config):
+        raise ValueError("Filter detections configuration not found.")
+
+    filter_config = config["filter_detections"]
+    serialize_config = config.get("serialize", {})
+
+    field_name = filter_config.get("field_name", "probs")
+    threshold = filter_config.get("threshold", 0.5)
+    filter_source = filter_config.get("filter_source", "AUTO")
+    quantization_scale = filter_config.get("quantization_scale", None)
+
+    if ("schema" not in filter_config):
+        raise ValueError("Schema configuration not found.")
+
+    schema_config = filter_config["schema"]
+    message_type = resolve_message_type(schema_config["input_message_type"], schema_config.get("encoding", "latin1"))
+
+    filter_source = resolve_filter_source(filter_source, message_type)
+
+    include_columns = serialize_config.get("include", None)
+    exclude_columns = serialize_config.get("exclude", [r'^ID$', r'^_ts_'])
+    fixed_columns = serialize_config.get("fixed_columns", True)
+    columns = serialize_config.get("columns", None)
+    use_cpp = serialize_config.get("use_cpp", False)
+
+    if (include_columns is not None and len(include_columns) > 0):
+        include_columns = re.compile("({})".format("|".join(include_columns)))
+    else:
+        include_columns = None
+
+    exclude_columns = [re.compile(x) for x in exclude_columns]
+
+    if filter_source == FilterSource.TENSOR:
+
+        def get_detections(multi_message: MultiMessage) -> cp.ndarray:
+            probs = multi_message.get_output(field_name)
+            detections = cp.empty(probs.shape[0], dtype=cp.bool_)
+
+            build_detections_fn(probs.ndim, probs.dtype, threshold, quantization_scale)(probs, detections)
+
+            return detections
+    else:
+
+        def get_detections(multi_message: MultiMessage) -> typing.Union[cp.ndarray, np.ndarray]:
+            return get_column_detections(multi_message, field_name, threshold)
+
+    def get_selected_columns(multi_message: MultiMessage) -> typing.List[str]:
+        nonlocal columns
+
+        if fixed_columns and columns is not None:
+            return columns
+
+        # The `df` property returns a deep copy of the DataFrame, only the column names are needed here
+        with multi_message.meta.mutable_dataframe() as df:
+            selected_columns = select_columns(list(df.columns), include_columns, exclude_columns)
+
+        # Fixed columns are only determined from the first message
+        if fixed_columns:
+            columns = selected_columns
+
+        return selected_columns
+
+    def filter_serialize(multi_message: MultiMessage) -> typing.Union[MessageMeta, None]:
+        """
+        Selects the rows above the threshold and the configured columns of a message.
+
+        Parameters
+        ----------
+        multi_message : `morpheus.pipeline.messages.MultiMessage`
+            Response message with probabilities calculated from inference results.
+
+        Returns
+        -------
+        `morpheus.messages.MessageMeta`
+            A new message containing a copy of the selected columns for the rows above the threshold.
+
+        """
+        if multi_message is None:
+            return None
+
+        detections = get_detections(multi_message)
+
+        if (not detections.any()):
+            return None
+
+        df = multi_message.get_meta(get_selected_columns(multi_message))
+
+        if (isinstance(df, pd.DataFrame)):
+            if (isinstance(detections, cp.ndarray)):
+                detections = detections.get()
+
+            df = df[detections]
+
+            if (use_cpp):
+                df = cudf.from_pandas(df)
+        else:
+            df = df[detections]
+
+        return MessageMeta(df=df)
+
+    node = builder.make_node(FUSED_FILTER_SERIALIZE, filter_serialize)
+
+    # Register input and output port for a module.
+    builder.register_module_input("input", node)
+    builder.register_module_output("output", node)
@@ -31,6 +31,26 @@ from morpheus.utils.module_utils import register_module
 logger = logging.getLogger(__name__)
 
 
+def select_columns(df_columns: typing.List[str],
+                    include_columns: typing.Pattern,
+                    exclude_columns: typing.List[typing.Pattern]) -> typing.List[str]:
+    """
+    Returns the names in `df_columns` matching `include_columns` (or all of them when it is `None`), minus any matching
+    one of `exclude_columns`.
+    """
+    # First build up list of included. If no include regex is specified, select all
+    if (include_columns is None):
+        columns = df_columns
+    else:
+        columns = [y for y in df_columns if include_columns.match(y)]
+
+    # Now remove by the ignore
+    for test in exclude_columns:
+        columns = [y for y in columns if not test.match(y)]
+
+    return columns
+
+
 @register_module(SERIALIZE, MORPHEUS_MODULE_NAMESPACE)
 def serialize(builder: mrc.Builder):
     """
@@ -85,22 +105,8 @@ def serialize(builder: mrc.Builder):
         if fixed_columns and columns is not None:
             columns = columns
         else:
-            columns: typing.List[str] = []
-
             # Minimize access to x.meta.df
-            df_columns = list(x.meta.df.columns)
-
-            # First build up list of included. If no include regex is specified, select all
-            if (include_columns is None):
-                columns = df_columns
-            else:
-                columns = [y for y in df_columns if include_columns.match(y)]
-
-            # Now remove by the ignore
-            for test in exclude_columns:
-                columns = [y for y in columns if not test.match(y)]
-
-            columns = columns
+            columns = select_columns(list(x.meta.df.columns), include_columns, exclude_columns)
 
         # Get metadata from columns
         df = x.get_meta(columns)
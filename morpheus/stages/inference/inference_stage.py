@@ -304,11 +304,11 @@ class InferenceStage(MultiMessageStage):
 
         out_batches = []
 
-        id_array = cp.concatenate([cp.array([-1]), x.get_input("seq_ids")[:, 0], cp.array([-1])])
+        seq_ids = x.get_input("seq_ids")[:, 0]
 
-        diff_ids = cp.where(id_array[1:] != id_array[:-1])[0]
-
-        diff_ids = diff_ids.tolist()
+        # Find where the id changes on the device, the first and last rows are always boundaries so they are added on
+        # the host rather than padding the ids with small host to device copies
+        diff_ids = [0] + (cp.flatnonzero(seq_ids[1:] != seq_ids[:-1]) + 1).tolist() + [len(seq_ids)]
 
         head = 0
         tail = 0
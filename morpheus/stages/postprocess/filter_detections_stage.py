@@ -29,6 +29,7 @@ from morpheus.messages import MultiMessage
 from morpheus.messages import MultiResponseMessage
 from morpheus.pipeline.single_port_stage import SinglePortStage
 from morpheus.pipeline.stream_pair import StreamPair
+from morpheus.utils.detection_utils import find_edges
 
 logger = logging.getLogger(__name__)
 
@@ -122,21 +123,14 @@ class FilterDetectionsStage(SinglePortStage):
         else:
             filter_source = x.get_meta(self._field_name).values
 
-        if (isinstance(filter_source, np.ndarray)):
-            array_mod = np
-        else:
-            array_mod = cp
-
         # Get per row detections
         detections = (filter_source > self._threshold)
 
         if (len(detections.shape) > 1):
             detections = detections.any(axis=1)
 
-        # Surround in False to ensure we get an even number of pairs
-        detections = array_mod.concatenate([array_mod.array([False]), detections, array_mod.array([False])])
-
-        return array_mod.where(detections[1:] != detections[:-1])[0].reshape((-1, 2))
+        # Shares the edge finder with the filter detections module
+        return find_edges(detections).reshape((-1, 2))
 
     def filter_copy(self, x: MultiMessage) -> MultiMessage:
         """
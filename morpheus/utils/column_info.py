@@ -93,6 +93,12 @@ class ColumnInfo:
 
         return df[self.name]
 
+    def _get_input_columns(self) -> typing.Optional[typing.List[str]]:
+        """
+        Returns the names of the input columns used by `_process_column`, or `None` when they cannot be determined.
+        """
+        return [self.name]
+
 
 @dataclasses.dataclass
 class CustomColumn(ColumnInfo):
@@ -102,6 +108,10 @@ class CustomColumn(ColumnInfo):
     def _process_column(self, df: pd.DataFrame) -> pd.Series:
         return self.process_column_fn(df)
 
+    def _get_input_columns(self) -> typing.Optional[typing.List[str]]:
+        # Any column could be used by `process_column_fn`
+        return None
+
 
 @dataclasses.dataclass
 class RenameColumn(ColumnInfo):
@@ -114,6 +124,9 @@ class RenameColumn(ColumnInfo):
 
         return df[self.input_name]
 
+    def _get_input_columns(self) -> typing.Optional[typing.List[str]]:
+        return [self.input_name]
+
 
 @dataclasses.dataclass
 class BoolColumn(RenameColumn):
@@ -180,6 +193,9 @@ class StringCatColumn(ColumnInfo):
 
         return first_col.str.cat(others=df[self.input_columns[1:]], sep=self.sep)
 
+    def _get_input_columns(self) -> typing.Optional[typing.List[str]]:
+        return list(self.input_columns)
+
 
 @dataclasses.dataclass
 class IncrementColumn(DateTimeColumn):
@@ -196,6 +212,9 @@ class IncrementColumn(DateTimeColumn):
         # Create the `groupby_column`, per-period log count
         return df.groupby([self.groupby_column, period]).cumcount()
 
+    def _get_input_columns(self) -> typing.Optional[typing.List[str]]:
+        return [self.input_name, self.groupby_column]
+
 
 @dataclasses.dataclass
 class DataFrameInputSchema:
@@ -222,6 +241,33 @@ class DataFrameInputSchema:
 
         self.preserve_columns = input_preserve_columns
 
+    @property
+    def input_columns(self) -> typing.Optional[typing.List[str]]:
+        """
+        Names of the columns of the input `DataFrame` used by this schema. Columns produced by normalizing one of the
+        `json_columns` are reported as the JSON column itself. Returns `None` when the columns cannot be determined,
+        such as when `preserve_columns` or a `CustomColumn` is used.
+        """
+        if (self.preserve_columns is not None):
+            return None
+
+        json_columns = self.json_columns or []
+        input_columns = []
+
+        for ci in self.column_info:
+            ci_columns = ci._get_input_columns()
+
+            if (ci_columns is None):
+                return None
+
+            for col in ci_columns:
+                col = next((j for j in json_columns if col == j or col.startswith(f"{j}.")), col)
+
+                if (col not in input_columns):
+                    input_columns.append(col)
+
+        return input_columns
+
 
 def _process_columns(df_in, input_schema: DataFrameInputSchema):
     # TODO(MDD): See what causes this to have such a perf impact over using df_in
@@ -306,10 +352,18 @@ def _filter_rows(df_in: pd.DataFrame, input_schema: DataFrameInputSchema):
     return input_schema.row_filter(df_in)
 
 
-def process_dataframe(df_in: pd.DataFrame, input_schema: DataFrameInputSchema) -> pd.DataFrame:
+def process_dataframe(df_in: typing.Union[pd.DataFrame, cudf.DataFrame],
+                      input_schema: DataFrameInputSchema) -> typing.Union[pd.DataFrame, cudf.DataFrame]:
     """
-    Applies colmn transformations as defined by `input_schema`
+    Applies colmn transformations as defined by `input_schema`. When `df_in` is a cuDF DataFrame, it is converted to
+    pandas once for all of the steps and the result is converted back to cuDF.
     """
+    convert_to_cudf = False
+
+    if (isinstance(df_in, cudf.DataFrame)):
+        df_in = df_in.to_pandas()
+        convert_to_cudf = True
+
     # Step 1 is to normalize any columns
     df_processed = _normalize_dataframe(df_in, input_schema)
 
@@ -319,4 +373,7 @@ def process_dataframe(df_in: pd.DataFrame, input_schema: DataFrameInputSchema) -
     # Step 3 is to run the row filter if needed
     df_processed = _filter_rows(df_processed, input_schema)
 
+    if (convert_to_cudf):
+        return cudf.from_pandas(df_processed)
+
     return df_processed
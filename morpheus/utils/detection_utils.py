@@ -0,0 +1,216 @@
+# Copyright (c) 2023, NVIDIA CORPORATION.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import math
+import pickle
+import typing
+from functools import lru_cache
+
+import cupy as cp
+import numpy as np
+import typing_utils
+
+import cudf
+
+from morpheus.common import FilterSource
+from morpheus.messages import MultiMessage
+from morpheus.messages.multi_response_message import MultiResponseMessage
+
+_PICKLE_PREFIX = "pickle:"
+
+# Fuses the threshold comparison with the reduction across columns, avoiding an intermediate (rows, cols) bool tensor.
+# The threshold has its own type, allowing integer and bool tensors to be compared against a floating point threshold.
+_row_any_above_threshold = cp.ReductionKernel("T x, U threshold",
+                                              "bool y",
+                                              "x > threshold",
+                                              "a || b",
+                                              "y = a",
+                                              "false",
+                                              "filter_detections_row_any_above_threshold",
+                                              reduce_type="bool")
+
+# Accumulates one column into an existing per-row mask, used for column-major tensors where each column is contiguous
+_or_above_threshold = cp.ElementwiseKernel("T x, U threshold",
+                                           "bool y",
+                                           "y = y || (x > threshold)",
+                                           "filter_detections_or_above_threshold")
+
+# Flags the rows where a mask changes value, treating the rows before and after the mask as `False`. This handles the
+# boundaries in the kernel rather than padding the mask, which would need small host to device copies.
+_mask_edges = cp.ElementwiseKernel("raw bool mask, int64 num_rows",
+                                   "bool edge",
+                                   """
+                                   const bool previous = (i > 0) ? mask[i - 1] : false;
+                                   const bool current = (i < num_rows) ? mask[i] : false;
+                                   edge = (previous != current);
+                                   """,
+                                   "filter_detections_mask_edges")
+
+
+def find_edges(mask: typing.Union[cp.ndarray, np.ndarray]) -> typing.Union[cp.ndarray, np.ndarray]:
+    """
+    Returns the indices where the boolean `mask` changes value, treating the rows before and after it as `False`. Each
+    pair of edges is the `[start, stop)` range of a run of `True` values, use `find_edges(mask).reshape((-1, 2))` to
+    get the ranges.
+
+    Parameters
+    ----------
+    mask : typing.Union[cupy.ndarray, numpy.ndarray]
+        One dimensional array of booleans.
+
+    Returns
+    -------
+    typing.Union[cupy.ndarray, numpy.ndarray]
+        Indices of the edges, using the same array library as `mask`.
+    """
+    num_rows = mask.shape[0]
+
+    if (isinstance(mask, cp.ndarray)):
+        return cp.flatnonzero(_mask_edges(mask, num_rows, size=num_rows + 1))
+
+    # Viewing the mask as int8 lets diff find the run boundaries without a bool->int temporary, padding with zeros
+    # on either side ensures we get an even number of edges
+    zero = np.int8(0)
+    return np.flatnonzero(np.diff(mask.view(np.int8), prepend=zero, append=zero))
+
+
+def _get_dtype_threshold(threshold: float, dtype: np.dtype, quantization_scale: float = None) -> np.generic:
+    """
+    Returns the scalar to compare a tensor of `dtype` against. Floating point tensors are compared against `threshold`
+    cast to `dtype`, all other tensors against `threshold` as a `float64` so the comparison matches the
+    `FilterDetectionsStage`.
+
+    When `quantization_scale` is set, integer tensors are instead treated as probabilities quantized as
+    `round(p * quantization_scale)` (i.e. `255` for `uint8`) and the threshold is quantized so the tensor can be
+    compared as-is. The quantized threshold is only cast to `dtype` when it is representable by it.
+    """
+    if (dtype.kind == "f"):
+        return dtype.type(threshold)
+
+    if (quantization_scale is not None and dtype.kind in ("i", "u")):
+        quantized_threshold = math.floor(threshold * quantization_scale)
+        dtype_info = np.iinfo(dtype)
+
+        if (dtype_info.min <= quantized_threshold <= dtype_info.max):
+            return dtype.type(quantized_threshold)
+
+        return np.float64(quantized_threshold)
+
+    return np.float64(threshold)
+
+
+@lru_cache(maxsize=None)
+def build_detections_fn(ndim: int, dtype: np.dtype, threshold: float,
+                        quantization_scale: float = None) -> typing.Callable[[cp.ndarray, cp.ndarray], typing.Any]:
+    """
+    Returns a function writing the per-row detections of a device tensor with the given `ndim` and `dtype` into an
+    output mask. The shape and type of an output tensor are fixed by the model, so this is built once and reused rather
+    than re-deciding how to threshold every message.
+
+    Parameters
+    ----------
+    ndim : int
+        Number of dimensions of the tensor.
+    dtype : numpy.dtype
+        Type of the tensor.
+    threshold : float
+        Rows with any value above `threshold` are detections.
+    quantization_scale : float, optional
+        Scale of integer tensors holding quantized probabilities, see `_get_dtype_threshold`.
+
+    Returns
+    -------
+    typing.Callable[[cupy.ndarray, cupy.ndarray], typing.Any]
+        Function taking the tensor and a boolean output mask with one element per row.
+    """
+    dtype_threshold = _get_dtype_threshold(threshold, dtype, quantization_scale)
+
+    if (ndim == 1):
+
+        def detections_fn(probs: cp.ndarray, detections: cp.ndarray):
+            cp.greater(probs, dtype_threshold, out=detections)
+
+        return detections_fn
+
+    def detections_fn(probs: cp.ndarray, detections: cp.ndarray):
+        if (probs.flags.f_contiguous and not probs.flags.c_contiguous):
+            # Reducing across the columns of a column-major tensor would read each row with a stride of `num_rows`,
+            # instead accumulate one contiguous column at a time into the mask
+            cp.greater(probs[:, 0], dtype_threshold, out=detections)
+
+            for column in range(1, probs.shape[1]):
+                _or_above_threshold(probs[:, column], dtype_threshold, detections)
+        else:
+            if (not probs.flags.c_contiguous):
+                probs = cp.ascontiguousarray(probs)
+
+            _row_any_above_threshold(probs, dtype_threshold, axis=1, out=detections)
+
+    return detections_fn
+
+
+@lru_cache(maxsize=None)
+def resolve_message_type(qualname: str, encoding: str = "latin1") -> type:
+    """
+    Resolve a fully-qualified class name such as `morpheus.messages.MultiMessage` into the class itself. Only values
+    explicitly prefixed with `pickle:` are treated as a pickled type.
+    """
+    if (qualname.startswith(_PICKLE_PREFIX)):
+        return pickle.loads(bytes(qualname[len(_PICKLE_PREFIX):], encoding))
+
+    module_name, _, class_name = qualname.rpartition(".")
+
+    if (not module_name or not all(part.isidentifier() for part in qualname.split("."))):
+        raise ValueError(f"Invalid input message type '{qualname}'. Expected a fully-qualified class name such as "
+                         f"'morpheus.messages.MultiMessage', pickled types must be prefixed with '{_PICKLE_PREFIX}'")
+
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def resolve_filter_source(filter_source: str, message_type: type) -> FilterSource:
+    """
+    Convert the `filter_source` config value into a `FilterSource`, inferring it from `message_type` for `AUTO`.
+    """
+    if filter_source == "AUTO":
+        if (typing_utils.issubtype(message_type, MultiResponseMessage)):
+            return FilterSource.TENSOR
+
+        # logger.debug(f"filter_source was set to Auto, infering a filter source of {filter_source} based on an input "
+        #             "message type of {message_type}")
+        return FilterSource.DATAFRAME
+
+    if filter_source == "TENSOR":
+        return FilterSource.TENSOR
+
+    if filter_source == "DATAFRAME":
+        return FilterSource.DATAFRAME
+
+    raise Exception("Unknown filter source: {}".format(filter_source))
+
+
+def get_column_detections(multi_message: MultiMessage, field_name: str,
+                          threshold: float) -> typing.Union[cp.ndarray, np.ndarray]:
+    """
+    Returns the per-row detections of the `field_name` column of a message, null values are never detections. The mask
+    is a `cupy.ndarray` for cuDF backed messages and a `numpy.ndarray` for pandas backed messages.
+    """
+    # Compare the column in place rather than materializing it with `.values` first, only the boolean result is
+    # converted to an array
+    detections = multi_message.get_meta(field_name) > threshold
+
+    if (isinstance(detections, cudf.Series)):
+        return detections.fillna(False).values
+
+    return detections.to_numpy()
@@ -18,8 +18,10 @@ import re
 import typing
 from datetime import datetime
 from datetime import timezone
+from functools import lru_cache
 
 import fsspec
+import fsspec.core
 
 import morpheus
 
@@ -79,6 +81,51 @@ def load_labels_file(labels_filename: str) -> typing.List[str]:
         return [x.strip() for x in lf.readlines()]
 
 
+@lru_cache(maxsize=None)
+def _get_filesystem(protocol: str) -> fsspec.AbstractFileSystem:
+    return fsspec.filesystem(protocol)
+
+
+def get_filesystem_and_paths(files: typing.List[str]) -> typing.Tuple[fsspec.AbstractFileSystem, typing.List[str]]:
+    """
+    Returns the file system and the protocol stripped paths for a list of fully qualified file names. Unlike
+    `fsspec.open_files`, no glob expansion is performed and no `OpenFile` objects are created, files can be opened
+    lazily using the returned file system.
+
+    Parameters
+    ----------
+    files : typing.List[str]
+        List of file names, all files must share the same protocol.
+
+    Returns
+    -------
+    typing.Tuple[fsspec.AbstractFileSystem, typing.List[str]]
+        File system and list of paths.
+    """
+    protocols = {fsspec.core.split_protocol(file_name)[0] or "file" for file_name in files}
+
+    if (len(protocols) > 1):
+        raise ValueError(f"All files must share the same protocol, found: {sorted(protocols)}")
+
+    fs = _get_filesystem(protocols.pop() if protocols else "file")
+
+    return fs, [fs._strip_protocol(file_name) for file_name in files]
+
+
+# Values of the date parts which are not captured by the filename regex, the year is always required
+_DATE_GROUP_DEFAULTS = (("year", None), ("month", 1), ("day", 1), ("hour", 0), ("minute", 0), ("second", 0))
+
+
+@lru_cache(maxsize=None)
+def _get_date_group_indices(filename_regex: re.Pattern) -> typing.Tuple[typing.Tuple[int, ...], int]:
+    if ("year" not in filename_regex.groupindex):
+        raise ValueError(f"The filename regex must capture the year, got: {filename_regex.pattern}")
+
+    date_group_indices = tuple(filename_regex.groupindex.get(name) for (name, _) in _DATE_GROUP_DEFAULTS)
+
+    return date_group_indices, filename_regex.groupindex.get("microsecond")
+
+
 def date_extractor(file_object: fsspec.core.OpenFile, filename_regex: re.Pattern):
     """
     Date is extracted from a file name using a specified regex pattern by this function.
@@ -104,17 +151,18 @@ def date_extractor(file_object: fsspec.core.OpenFile, filename_regex: re.Pattern
     match = filename_regex.search(file_path)
 
     if (match):
-        # Convert the regex match
-        groups = match.groupdict()
-
-        if ("microsecond" in groups):
-            groups["microsecond"] = int(float(groups["microsecond"]) * 1000000)
+        # Convert the regex match. Look up the groups by their position instead of building a `groupdict()` per file
+        date_group_indices, microsecond_index = _get_date_group_indices(filename_regex)
 
-        groups = {key: int(value) for key, value in groups.items()}
+        date_parts = [
+            int(match.group(idx)) if idx is not None else default
+            for (idx, (_, default)) in zip(date_group_indices, _DATE_GROUP_DEFAULTS)
+        ]
 
-        groups["tzinfo"] = timezone.utc
+        microsecond = match.group(microsecond_index) if microsecond_index is not None else None
+        microsecond = int(float(microsecond) * 1000000) if microsecond else 0
 
-        ts_object = datetime(**groups)
+        ts_object = datetime(*date_parts, microsecond, tzinfo=timezone.utc)
     else:
         # Otherwise, fallback to the file modified (created?) time
         ts_object = file_object.fs.modified(file_object.path)
@@ -19,6 +19,7 @@ FILE_BATCHER = "FileBatcher"
 FILE_TO_DF = "FileToDF"
 FILTER_CONTROL_MESSAGE = "FilterControlMessage"
 FILTER_DETECTIONS = "FilterDetections"
+FUSED_FILTER_SERIALIZE = "FusedFilterSerialize"
 MLFLOW_MODEL_WRITER = "MLFlowModelWriter"
 SERIALIZE = "Serialize"
 WRITE_TO_FILE = "WriteToFile"
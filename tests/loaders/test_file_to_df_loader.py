@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import pickle
+import typing
+from unittest import mock
+
+import fsspec
+import numpy as np
+import pandas as pd
+import pytest
+
+from morpheus._lib.common import FileTypes
+from morpheus.loaders.file_to_df_loader import _is_transient_s3_error
+from morpheus.loaders.file_to_df_loader import _single_object_to_dataframe
+from morpheus.loaders.file_to_df_loader import file_to_df_loader
+from morpheus.messages import ControlMessage
+from morpheus.utils.column_info import ColumnInfo
+from morpheus.utils.column_info import DataFrameInputSchema
+
+DOWNLOAD_METHODS = ["single_thread", "threaded", "multiprocess", "multiprocessing", "dask", "dask_thread", "async"]
+
+SCHEMA = DataFrameInputSchema(column_info=[ColumnInfo(name="timestamp", dtype=int), ColumnInfo(name="v", dtype=str)])
+
+
+def _load_batch(file_names: list,
+                file_type: str,
+                cache_dir: str,
+                parser_kwargs: dict = None,
+                schema=SCHEMA,
+                read_pickle_cache: bool = False):
+    task = {
+        "files": file_names,
+        "batcher_config": {
+            "timestamp_column_name": "timestamp",
+            "schema": {
+                "schema_str": str(pickle.dumps(schema), encoding="latin1"), "encoding": "latin1"
+            },
+            "file_type": file_type,
+            "parser_kwargs": parser_kwargs,
+            "cache_dir": cache_dir,
+            "read_pickle_cache": read_pickle_cache,
+        }
+    }
+
+    return file_to_df_loader(ControlMessage(), task)
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("download_method", DOWNLOAD_METHODS)
+@pytest.mark.parametrize("file_type, parser_kwargs",
+                         [("CSV", None), ("JSON", None), ("JSON", {
+                             "lines": True
+                         }), ("JSON", {
+                             "lines": False, "orient": "records"
+                         })])
+def test_file_to_df_loader_batch(tmp_path, monkeypatch, download_method: str, file_type: str, parser_kwargs: dict):
+    monkeypatch.setenv("MORPHEUS_FILE_DOWNLOAD_TYPE", download_method)
+
+    # Each file holds half of the rows, interleaved by timestamp to check the batch is sorted after concatenating
+    expected_df = pd.DataFrame({"timestamp": list(range(6)), "v": [f"value_{i}" for i in range(6)]})
+
+    file_names = []
+    for (i, file_df) in enumerate([expected_df.iloc[0::2], expected_df.iloc[1::2]]):
+        file_name = os.path.join(tmp_path, f"batch_{i}.{file_type.lower()}")
+
+        if (file_type == "CSV"):
+            file_df.to_csv(file_name, index=False)
+        else:
+            file_df.to_json(file_name, orient="records", lines=(parser_kwargs or {}).get("lines", True))
+
+        file_names.append(file_name)
+
+    message = _load_batch(file_names, file_type, os.path.join(tmp_path, "cache"), parser_kwargs)
+
+    output_df = message.payload().df
+
+    assert output_df is not None
+    pd.testing.assert_frame_equal(output_df[["timestamp", "v"]].to_pandas(), expected_df, check_dtype=False)
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("download_method", DOWNLOAD_METHODS)
+def test_file_to_df_loader_json_columns(tmp_path, monkeypatch, download_method: str):
+    monkeypatch.setenv("MORPHEUS_FILE_DOWNLOAD_TYPE", download_method)
+
+    # The nested fields differ between the files
+    file_rows = [
+        [{"timestamp": 0, "properties": {"a": "a0"}}, {"timestamp": 2, "properties": {"a": "a2"}}],
+        [{"timestamp": 1, "properties": {"b": 1}}, {"timestamp": 3, "properties": {"a": "a3", "b": 3}}],
+    ]
+
+    file_names = []
+    for (i, rows) in enumerate(file_rows):
+        file_name = os.path.join(tmp_path, f"batch_{i}.json")
+        pd.DataFrame(rows).to_json(file_name, orient="records", lines=True)
+        file_names.append(file_name)
+
+    schema = DataFrameInputSchema(json_columns=["properties"],
+                                  column_info=[
+                                      ColumnInfo(name="timestamp", dtype=int),
+                                      ColumnInfo(name="properties.a", dtype=str),
+                                      ColumnInfo(name="properties.b", dtype=float)
+                                  ])
+
+    message = _load_batch(file_names, "JSON", os.path.join(tmp_path, "cache"), schema=schema)
+
+    output_df = message.payload().df.to_pandas()
+
+    assert output_df["timestamp"].tolist() == [0, 1, 2, 3]
+    assert output_df["properties.a"].tolist() == ["a0", None, "a2", "a3"]
+    np.testing.assert_array_equal(output_df["properties.b"].to_numpy(dtype=float), [np.nan, 1, np.nan, 3])
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("read_pickle_cache", [True, False])
+def test_file_to_df_loader_legacy_pickle_cache(tmp_path, monkeypatch, read_pickle_cache: bool):
+    monkeypatch.setenv("MORPHEUS_FILE_DOWNLOAD_TYPE", "single_thread")
+
+    file_name = os.path.join(tmp_path, "batch.json")
+    pd.DataFrame({"timestamp": [0, 1], "v": ["value_0", "value_1"]}).to_json(file_name, orient="records", lines=True)
+
+    # Write a cache named the way previous releases did, holding different rows than the file itself
+    fs = fsspec.filesystem("file")
+    legacy_hash = hashlib.md5(json.dumps([{"ukey": fs.ukey(file_name)}], sort_keys=True).encode()).hexdigest()
+
+    cache_dir = os.path.join(tmp_path, "cache")
+    legacy_cache_location = os.path.join(cache_dir, "file_cache", "batches", f"{legacy_hash}.pkl")
+    os.makedirs(os.path.dirname(legacy_cache_location))
+
+    cached_df = pd.DataFrame({"timestamp": [2, 3], "v": ["cached_2", "cached_3"]})
+    cached_df.to_pickle(legacy_cache_location)
+
+    message = _load_batch([file_name], "JSON", cache_dir, read_pickle_cache=read_pickle_cache)
+
+    output_df = message.payload().df.to_pandas()
+
+    if (read_pickle_cache):
+        assert output_df["v"].tolist() == ["cached_2", "cached_3"]
+    else:
+        assert output_df["v"].tolist() == ["value_0", "value_1"]
+
+
+def _make_client_error(code: str) -> Exception:
+    botocore_exceptions = pytest.importorskip("botocore.exceptions")
+
+    return botocore_exceptions.ClientError({"Error": {"Code": code}}, "GetObject")
+
+
+def _read_with_mock_fs(file_name: str, open_errors: list) -> typing.Tuple[pd.DataFrame, mock.MagicMock]:
+    fs = mock.MagicMock()
+    fs.open.side_effect = [*open_errors, open(file_name, "rb")]
+
+    with mock.patch("morpheus.loaders.file_to_df_loader.time.sleep"):
+        df = _single_object_to_dataframe(file_name,
+                                         fs=fs,
+                                         file_type=FileTypes.CSV,
+                                         filter_null=False,
+                                         parser_kwargs=None,
+                                         schema=SCHEMA,
+                                         input_columns=SCHEMA.input_columns)
+
+    return df, fs
+
+
+def test_is_transient_s3_error():
+    transient_error = _make_client_error("SlowDown")
+
+    # s3fs raises an OSError with the botocore error as the cause
+    wrapped_error = OSError("Please reduce your request rate")
+    wrapped_error.__cause__ = transient_error
+
+    assert _is_transient_s3_error(transient_error)
+    assert _is_transient_s3_error(wrapped_error)
+    assert not _is_transient_s3_error(_make_client_error("AccessDenied"))
+    assert not _is_transient_s3_error(ValueError("Invalid file"))
+
+
+@pytest.mark.use_python
+def test_single_object_to_dataframe_retry(tmp_path):
+    file_name = os.path.join(tmp_path, "file.csv")
+    pd.DataFrame({"timestamp": [0, 1], "v": ["a", "b"]}).to_csv(file_name, index=False)
+
+    # Transient errors are retried until the read succeeds
+    df, fs = _read_with_mock_fs(file_name, [_make_client_error("SlowDown"), _make_client_error("503")])
+
+    assert df["v"].tolist() == ["a", "b"]
+    assert fs.open.call_count == 3
+    assert fs.invalidate_cache.call_count == 2
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("error_code", ["AccessDenied", "NoSuchKey"])
+def test_single_object_to_dataframe_no_retry(error_code: str):
+    error = _make_client_error(error_code)
+
+    fs = mock.MagicMock()
+    fs.open.side_effect = error
+
+    # Other errors are raised without retrying
+    with mock.patch("morpheus.loaders.file_to_df_loader.time.sleep") as mock_sleep:
+        with pytest.raises(type(error)):
+            _single_object_to_dataframe("file.csv",
+                                        fs=fs,
+                                        file_type=FileTypes.CSV,
+                                        filter_null=False,
+                                        parser_kwargs=None,
+                                        schema=SCHEMA,
+                                        input_columns=SCHEMA.input_columns)
+
+    assert fs.open.call_count == 1
+    mock_sleep.assert_not_called()
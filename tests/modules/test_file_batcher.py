@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import typing
+
+import pandas as pd
+import pytest
+
+import cudf
+
+import morpheus.modules  # noqa: F401
+from morpheus.messages import ControlMessage
+from morpheus.messages.message_meta import MessageMeta
+from morpheus.utils.loader_ids import FILE_TO_DF_LOADER
+from morpheus.utils.module_ids import FILE_BATCHER
+from morpheus.utils.module_utils import to_period_cudf_approximation
+from utils import run_module
+
+
+def _run_file_batcher(file_names: typing.List[str], **config) -> typing.List[typing.List[str]]:
+    """
+    Runs the file batcher over `file_names` in streaming mode, returning the base names of the files in each batch.
+    """
+    control_message = ControlMessage()
+    control_message.payload(MessageMeta(cudf.DataFrame({"files": file_names})))
+    control_message.set_metadata("data_type", "streaming")
+
+    module_config = {
+        "schema": {
+            "schema_str": "string", "encoding": "latin1"
+        }, "timestamp_column_name": "timestamp", **config
+    }
+
+    results = run_module(FILE_BATCHER, module_config, [control_message])
+
+    # The files within a batch are ordered by timestamp, which may tie
+    return [sorted(os.path.basename(f) for f in result.remove_task("load")["files"]) for result in results]
+
+
+# Timestamps on either side of the minute, hour and day boundaries
+TIMESTAMPS = [
+    "2023-03-01T23:59:59", "2023-03-02T00:00:00", "2023-03-02T00:00:59", "2023-03-02T00:01:00", "2023-03-02T01:30:00",
+    "2023-03-02T02:00:00", "2023-03-02T05:59:59", "2023-03-02T06:00:00", "2023-03-03T12:00:00"
+]
+
+
+def _get_timestamp_file_names(tmp_path) -> typing.List[str]:
+    return [os.path.join(tmp_path, f"logs_{ts.replace(':', '_')}Z.json") for ts in TIMESTAMPS]
+
+
+def _group_file_names(file_names: typing.List[str], periods: typing.List[typing.Any]) -> typing.List[typing.List[str]]:
+    groups = {}
+    for (file_name, period) in zip(file_names, periods):
+        groups.setdefault(period, []).append(os.path.basename(file_name))
+
+    return [sorted(groups[period]) for period in sorted(groups)]
+
+
+def test_file_batcher_missing_date_parts(tmp_path):
+    file_names = [os.path.join(tmp_path, name) for name in ("logs_2023.json", "logs_2022.json", "other_2023.json")]
+
+    # Only the year is captured, the remaining parts default to the first day of the year
+    batches = _run_file_batcher(file_names, batch_iso_date_regex_pattern=r"_(?P<year>\d{4})\.json", period="D")
+
+    assert batches == [["logs_2022.json"], ["logs_2023.json", "other_2023.json"]]
+
+
+def test_file_batcher_sampling(tmp_path):
+    # Seconds since the first file: 0, 30, 70, 119 and 120, falling into the 60 second buckets 0, 0, 1, 1 and 2
+    file_names = [
+        os.path.join(tmp_path, f"logs_2023-03-01T00_{time}Z.json")
+        for time in ("01_59", "00_30", "00_00", "02_00", "01_10")
+    ]
+
+    batches = _run_file_batcher(file_names, period="D", sampling_rate_s=60)
+
+    # Only the first file in each bucket is kept
+    assert batches == [[
+        "logs_2023-03-01T00_00_00Z.json", "logs_2023-03-01T00_01_10Z.json", "logs_2023-03-01T00_02_00Z.json"
+    ]]
+
+
+@pytest.mark.parametrize("period", ["T", "H", "D"])
+def test_file_batcher_period(tmp_path, period: str):
+    file_names = _get_timestamp_file_names(tmp_path)
+
+    # The batches should match those produced by converting the timestamps to periods
+    ts_df = to_period_cudf_approximation(cudf.DataFrame({"ts": cudf.Series(pd.to_datetime(TIMESTAMPS))}), period)
+    expected = _group_file_names(file_names, ts_df["period"].to_arrow().to_pylist())
+
+    assert _run_file_batcher(file_names, period=period) == expected
+
+
+@pytest.mark.parametrize("period", ["30min", "2H", "6H", "2D"])
+def test_file_batcher_multiple_period(tmp_path, period: str):
+    file_names = _get_timestamp_file_names(tmp_path)
+
+    # Multiples of a period are aligned to the epoch
+    expected = _group_file_names(file_names, pd.Series(pd.to_datetime(TIMESTAMPS)).dt.floor(period).tolist())
+
+    assert _run_file_batcher(file_names, period=period) == expected
+
+
+def test_file_batcher_payload(tmp_path):
+    file_names = _get_timestamp_file_names(tmp_path)
+
+    control_message = ControlMessage()
+    control_message.payload(MessageMeta(cudf.DataFrame({"files": file_names[::-1]})))
+    control_message.set_metadata("data_type", "payload")
+
+    results = run_module(FILE_BATCHER, {"schema": {"schema_str": "string"}, "period": "D"}, [control_message])
+
+    # In payload mode the files of every period are collected into a load task of the incoming message
+    assert len(results) == 1
+
+    tasks = []
+    while (results[0].has_task("load")):
+        tasks.append(results[0].remove_task("load"))
+
+    expected = _group_file_names(file_names, [ts[:len("YYYY-MM-DD")] for ts in TIMESTAMPS])
+
+    assert [sorted(os.path.basename(f) for f in task["files"]) for task in tasks] == expected
+
+    for task in tasks:
+        assert task["loader_id"] == FILE_TO_DF_LOADER
+        assert task["n_groups"] == len(expected)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import typing
+
+import cupy as cp
+import numpy as np
+import pandas as pd
+import pytest
+
+import cudf
+
+import morpheus.modules  # noqa: F401
+from morpheus.common import FilterSource
+from morpheus.messages import MultiMessage
+from morpheus.messages import MultiResponseMessage
+from morpheus.messages import ResponseMemory
+from morpheus.messages.message_meta import MessageMeta
+from morpheus.stages.postprocess.filter_detections_stage import FilterDetectionsStage
+from morpheus.modules.filter_detections import _find_edges_jit
+from morpheus.modules.filter_detections import _find_edges_swar
+from morpheus.utils.detection_utils import _get_dtype_threshold
+from morpheus.utils.detection_utils import build_detections_fn
+from morpheus.utils.detection_utils import find_edges
+from morpheus.utils.detection_utils import resolve_message_type
+from morpheus.utils.module_ids import FILTER_DETECTIONS
+from utils import assert_df_equal
+from utils import run_module
+
+
+def _make_message(df, probs: cp.ndarray) -> MultiResponseMessage:
+    mem = ResponseMemory(count=len(df), tensors={"probs": probs})
+    return MultiResponseMessage(meta=MessageMeta(df), memory=mem)
+
+
+def _module_config(**kwargs) -> dict:
+    message_type = f"{MultiResponseMessage.__module__}.{MultiResponseMessage.__qualname__}"
+
+    return {"schema": {"input_message_type": message_type, "schema_str": "string"}, **kwargs}
+
+
+def _mask_to_ranges(mask: np.ndarray) -> typing.List[typing.List[int]]:
+    return np.flatnonzero(np.diff(mask.astype(np.int8), prepend=0, append=0)).reshape((-1, 2)).tolist()
+
+
+def _get_ranges(results: typing.List[MultiMessage]) -> typing.List[typing.List[int]]:
+    return [[result.mess_offset, result.mess_offset + result.mess_count] for result in results]
+
+
+def _get_probs(df) -> cp.ndarray:
+    if (isinstance(df, cudf.DataFrame)):
+        return df.to_cupy()
+
+    return cp.asarray(df.to_numpy())
+
+
+@pytest.mark.parametrize("num_rows", [0, 1, 7, 8, 9, 16, 17, 100, 1003])
+@pytest.mark.parametrize("run_length", [1, 3, 8, 50])
+@pytest.mark.parametrize("probability", [0.0, 0.01, 0.5, 1.0])
+def test_find_edges_swar(num_rows: int, run_length: int, probability: float):
+    rng = np.random.default_rng(num_rows * run_length)
+    mask = np.repeat(rng.random(num_rows // run_length + 1) < probability, run_length)[:num_rows]
+
+    edges = _find_edges_swar(mask)
+
+    assert len(edges) % 2 == 0
+    np.testing.assert_array_equal(edges, find_edges(mask))
+    np.testing.assert_array_equal(_find_edges_jit(mask), find_edges(mask))
+
+    # Each pair of edges should bound exactly the rows which are set
+    expected = np.zeros(num_rows, dtype=bool)
+    for (start, stop) in edges.reshape((-1, 2)):
+        expected[start:stop] = True
+
+    np.testing.assert_array_equal(expected, mask)
+
+
+@pytest.mark.parametrize("threshold", [-0.5, 0.0, 0.1, 0.5, 0.999, 1.0, 2.0])
+def test_get_dtype_threshold(threshold: float):
+    probs = np.linspace(0, 1, 1001, dtype=np.float32)
+    quantized = np.round(probs * 255).astype(np.uint8)
+
+    assert _get_dtype_threshold(threshold, np.dtype(np.float32)) == np.float32(threshold)
+
+    # Without a scale integer tensors are compared against the threshold itself
+    assert _get_dtype_threshold(threshold, quantized.dtype) == np.float64(threshold)
+
+    dtype_threshold = _get_dtype_threshold(threshold, quantized.dtype, quantization_scale=255)
+
+    # Comparing the quantized values should match comparing the values they represent
+    np.testing.assert_array_equal(quantized > dtype_threshold, (quantized.astype(np.float64) / 255) > threshold)
+
+
+def testresolve_message_type():
+    qualname = f"{MultiResponseMessage.__module__}.{MultiResponseMessage.__qualname__}"
+    assert resolve_message_type(qualname) is MultiResponseMessage
+
+    pickled_type = str(pickle.dumps(MultiResponseMessage), encoding="latin1")
+    assert resolve_message_type(f"pickle:{pickled_type}") is MultiResponseMessage
+
+    # Pickled types are only loaded when explicitly prefixed
+    with pytest.raises(ValueError):
+        resolve_message_type(pickled_type)
+
+    with pytest.raises(ValueError):
+        resolve_message_type("MultiResponseMessage")
+
+
+@pytest.mark.parametrize("ndim", [1, 2])
+@pytest.mark.parametrize("dtype", [np.bool_, np.uint8, np.int32, np.float16, np.float32, np.float64])
+@pytest.mark.parametrize("threshold", [-0.5, 0.0, 0.5, 1.0])
+def testbuild_detections_fn(ndim: int, dtype: np.dtype, threshold: float):
+    rng = np.random.default_rng(ndim)
+    probs = rng.integers(-1, 3, size=(100, 3)).astype(dtype)
+
+    if (ndim == 1):
+        probs = probs[:, 0]
+        expected = probs > threshold
+    else:
+        expected = (probs > threshold).any(axis=1)
+
+    for order in ("C", "F"):
+        probs_gpu = cp.asarray(probs, order=order)
+        detections = cp.empty(len(probs), dtype=cp.bool_)
+
+        build_detections_fn(probs.ndim, probs_gpu.dtype, threshold)(probs_gpu, detections)
+
+        # The result should match numpy comparing against the threshold itself, regardless of the tensor type
+        np.testing.assert_array_equal(detections.get(), expected)
+
+
+@pytest.mark.use_python
+def test_filter_detections_module_copy_tensor(filter_probs_df):
+    threshold = 0.5
+    probs = _get_probs(filter_probs_df)
+
+    # The tensor mask is computed on the device, for pandas DataFrames it needs to be copied to the host
+    results = run_module(FILTER_DETECTIONS,
+                         _module_config(threshold=threshold, filter_source="TENSOR", copy=True),
+                         [_make_message(filter_probs_df, probs)])
+
+    expected_df = filter_probs_df[(probs > threshold).any(axis=1).get()]
+
+    assert len(results) == 1
+    assert results[0].mess_count == len(expected_df)
+    assert assert_df_equal(results[0].get_meta(), expected_df)
+    assert cp.array_equal(results[0].get_output("probs"), probs[(probs > threshold).any(axis=1)])
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("batch_size", [1, 2, 3, 8])
+def test_filter_detections_module_batch(df_type: str, batch_size: int):
+    num_messages = 7
+    rows_per_message = 10
+    threshold = 0.9
+
+    probs = np.random.default_rng(batch_size).random((num_messages * rows_per_message, 3))
+
+    # Messages without any detections should be dropped
+    probs[20:30] = 0
+    probs[50:60] = 0
+
+    df = pd.DataFrame({"v": np.arange(len(probs))})
+    if (df_type == "cudf"):
+        df = cudf.from_pandas(df)
+
+    meta = MessageMeta(df)
+    mem = ResponseMemory(count=len(df), tensors={"probs": cp.asarray(probs)})
+    messages = [
+        MultiResponseMessage(meta=meta,
+                             mess_offset=start,
+                             mess_count=rows_per_message,
+                             memory=mem,
+                             offset=start,
+                             count=rows_per_message) for start in range(0, len(df), rows_per_message)
+    ]
+
+    # The number of messages is not a multiple of the batch size, the remainder is flushed once the input completes
+    results = run_module(FILTER_DETECTIONS,
+                         _module_config(threshold=threshold, filter_source="TENSOR", copy=True, batch_size=batch_size),
+                         messages)
+
+    detections = (probs > threshold).any(axis=1)
+    expected_rows = [
+        start + np.flatnonzero(detections[start:start + rows_per_message])
+        for start in range(0, len(df), rows_per_message)
+    ]
+    expected_rows = [rows for rows in expected_rows if len(rows) > 0]
+
+    assert len(results) == len(expected_rows)
+
+    # Each message should only hold its own share of the batch
+    for (result, rows) in zip(results, expected_rows):
+        assert result.mess_count == len(rows)
+        assert result.get_meta("v").to_numpy().tolist() == rows.tolist()
+        assert cp.array_equal(result.get_output("probs"), cp.asarray(probs[rows]))
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("ndim", [1, 2])
+@pytest.mark.parametrize("dtype", [np.uint8, np.int32, np.float16, np.float32, np.float64])
+def test_filter_detections_module_slice_tensor(ndim: int, dtype: np.dtype):
+    threshold = 0.5
+    probs = np.random.default_rng(ndim).random((100, 3))
+
+    # Integer tensors hold either zero or one
+    if (np.dtype(dtype).kind != "f"):
+        probs = probs > 0.8
+
+    probs = probs.astype(dtype)
+
+    if (ndim == 1):
+        probs = probs[:, 0]
+        mask = probs > threshold
+    else:
+        mask = (probs > threshold).any(axis=1)
+
+    df = cudf.DataFrame({"v": np.arange(len(probs))})
+
+    # Single and double precision tensors are handled by the C++ library, other types are thresholded in Python
+    results = run_module(FILTER_DETECTIONS,
+                         _module_config(threshold=threshold, filter_source="TENSOR", copy=False),
+                         [_make_message(df, cp.asarray(probs))])
+
+    assert _get_ranges(results) == _mask_to_ranges(mask)
+
+    for result in results:
+        assert cp.array_equal(result.get_output("probs"),
+                              cp.asarray(probs[result.mess_offset:result.mess_offset + result.mess_count]))
+
+
+@pytest.mark.use_python
+def test_filter_detections_module_slice_dataframe(df_type: str):
+    threshold = 0.5
+    values = np.random.default_rng(1).random(100)
+
+    # Null values are never detections
+    values[[0, 10, 11, 50]] = np.nan
+
+    df = pd.DataFrame({"v": values})
+    if (df_type == "cudf"):
+        df = cudf.from_pandas(df, nan_as_null=True)
+
+    results = run_module(FILTER_DETECTIONS,
+                         _module_config(threshold=threshold, filter_source="DATAFRAME", field_name="v", copy=False),
+                         [MultiMessage(meta=MessageMeta(df))])
+
+    assert _get_ranges(results) == _mask_to_ranges(np.nan_to_num(values) > threshold)
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("rows", [[0, 1, 2], [7, 8, 9], [], [0, 4, 5, 9], list(range(10))])
+@pytest.mark.parametrize("dtype", [np.float16, np.float32])
+def test_filter_detections_module_slice_matches_stage(config, rows: typing.List[int], dtype: np.dtype):
+    threshold = 0.5
+    num_rows = 10
+
+    # Runs of detections at the start, at the end, none at all, several and every row
+    probs = np.full((num_rows, 3), 0.1, dtype=dtype)
+    probs[np.array(rows, dtype=int), 1] = 0.9
+    probs = cp.asarray(probs)
+
+    df = cudf.DataFrame({"v": np.arange(num_rows)})
+
+    stage = FilterDetectionsStage(config, threshold=threshold, copy=False, filter_source=FilterSource.TENSOR)
+    expected = stage.filter_slice(_make_message(df, probs))
+
+    results = run_module(FILTER_DETECTIONS,
+                         _module_config(threshold=threshold, filter_source="TENSOR", copy=False),
+                         [_make_message(df, probs)])
+
+    assert _get_ranges(results) == _get_ranges(expected)
+    assert _get_ranges(results) == _mask_to_ranges(np.isin(np.arange(num_rows), rows))
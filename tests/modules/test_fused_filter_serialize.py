@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import pytest
+
+import cudf
+
+import morpheus.modules  # noqa: F401
+from morpheus.messages import MultiResponseMessage
+from morpheus.messages import ResponseMemory
+from morpheus.messages.message_meta import MessageMeta
+from morpheus.utils.module_ids import FILTER_DETECTIONS
+from morpheus.utils.module_ids import FUSED_FILTER_SERIALIZE
+from morpheus.utils.module_ids import SERIALIZE
+from utils import assert_df_equal
+from utils import run_module
+
+
+def _make_messages(df, num_messages: int):
+    if (isinstance(df, cudf.DataFrame)):
+        probs = df.to_cupy()
+    else:
+        probs = cp.asarray(df.to_numpy())
+
+    # Split the rows between several messages sharing the same DataFrame
+    meta = MessageMeta(df)
+    mem = ResponseMemory(count=len(df), tensors={"probs": probs})
+
+    step = len(df) // num_messages + 1
+    return [
+        MultiResponseMessage(meta=meta,
+                             mess_offset=start,
+                             mess_count=min(step, len(df) - start),
+                             memory=mem,
+                             offset=start,
+                             count=min(step, len(df) - start)) for start in range(0, len(df), step)
+    ]
+
+
+@pytest.mark.use_python
+@pytest.mark.parametrize("filter_source, field_name", [("TENSOR", "probs"), ("DATAFRAME", "v2")])
+@pytest.mark.parametrize("columns", [None, ["v2", "v3"]])
+@pytest.mark.parametrize("threshold", [0.5, 0.9])
+def test_fused_filter_serialize(filter_probs_df, filter_source: str, field_name: str, columns: list, threshold: float):
+    filter_config = {
+        "field_name": field_name,
+        "threshold": threshold,
+        "filter_source": filter_source,
+        "copy": True,
+        "schema": {
+            "input_message_type": f"{MultiResponseMessage.__module__}.{MultiResponseMessage.__qualname__}",
+            "schema_str": "string"
+        }
+    }
+    serialize_config = {"columns": columns}
+
+    messages = _make_messages(filter_probs_df, num_messages=4)
+
+    expected = run_module(SERIALIZE, serialize_config, run_module(FILTER_DETECTIONS, filter_config, messages))
+    fused_config = {"filter_detections": filter_config, "serialize": serialize_config}
+    results = run_module(FUSED_FILTER_SERIALIZE, fused_config, messages)
+
+    assert len(results) == len(expected)
+
+    for (result, expected_meta) in zip(results, expected):
+        assert isinstance(result, MessageMeta)
+
+        result_df = result.copy_dataframe()
+        expected_df = expected_meta.copy_dataframe()
+
+        assert type(result_df) is type(expected_df)
+        assert list(result_df.columns) == list(expected_df.columns)
+        assert assert_df_equal(result_df, expected_df)
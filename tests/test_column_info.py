@@ -21,6 +21,8 @@ from functools import partial
 import pandas as pd
 import pytest
 
+import cudf
+
 from morpheus.utils.column_info import ColumnInfo
 from morpheus.utils.column_info import CustomColumn
 from morpheus.utils.column_info import DataFrameInputSchema
@@ -158,6 +160,53 @@ def test_dataframe_input_schema_without_json_cols():
         process_dataframe(input_df, schema2)
 
 
+@pytest.mark.use_python
+def test_dataframe_input_schema_cudf_row_filter():
+    df = cudf.DataFrame({"city": ["Boston", "Dallas", "Austin"], "zipcode": [2108, 75001, 73301]})
+
+    def pandas_row_filter(df_in: pd.DataFrame) -> pd.DataFrame:
+        # The row filter should always receive a pandas DataFrame
+        assert isinstance(df_in, pd.DataFrame)
+        return df_in[df_in["zipcode"] > 10000]
+
+    schema = DataFrameInputSchema(column_info=[ColumnInfo(name="city", dtype=str)],
+                                  preserve_columns=["zipcode"],
+                                  row_filter=pandas_row_filter)
+
+    df_processed = process_dataframe(df, schema)
+
+    assert isinstance(df_processed, cudf.DataFrame)
+    assert df_processed["city"].to_arrow().to_pylist() == ["Dallas", "Austin"]
+
+
+@pytest.mark.use_python
+def test_dataframe_input_schema_input_columns():
+    column_info = [
+        DateTimeColumn(name="timestamp", dtype=datetime, input_name="time"),
+        RenameColumn(name="userId", dtype=str, input_name="properties.userPrincipalName"),
+        ColumnInfo(name="category", dtype=str),
+        StringCatColumn(name="location",
+                        dtype=str,
+                        input_columns=[
+                            "properties.location.city",
+                            "properties.location.countryOrRegion",
+                        ],
+                        sep=", "),
+    ]
+
+    schema = DataFrameInputSchema(json_columns=["properties"], column_info=column_info)
+    assert schema.input_columns == ["time", "properties", "category"]
+
+    schema = DataFrameInputSchema(column_info=column_info, preserve_columns=["_batch_id"])
+    assert schema.input_columns is None
+
+    custom_col = CustomColumn(name="city_upper",
+                              dtype=str,
+                              process_column_fn=partial(convert_to_upper, column_name="city"))
+    schema = DataFrameInputSchema(column_info=column_info + [custom_col])
+    assert schema.input_columns is None
+
+
 @pytest.mark.use_python
 def test_string_cat_column():
 
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+from datetime import datetime
+from datetime import timezone
+
+import fsspec
+import pytest
+
+from morpheus.utils.file_utils import date_extractor
+
+
+@pytest.mark.parametrize("file_name, filename_regex, expected",
+                         [("logs_2023-03-14T10_11_12.5Z.json",
+                           r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})T(?P<hour>\d{1,2})_(?P<minute>\d{1,2})_"
+                           r"(?P<second>\d{1,2})(?P<microsecond>\.\d{1,6})?Z",
+                           datetime(2023, 3, 14, 10, 11, 12, 500000, tzinfo=timezone.utc)),
+                          ("logs_2023-03-14.json",
+                           r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})",
+                           datetime(2023, 3, 14, tzinfo=timezone.utc)),
+                          ("logs_2023.json", r"_(?P<year>\d{4})\.", datetime(2023, 1, 1, tzinfo=timezone.utc))])
+def test_date_extractor(tmp_path, file_name: str, filename_regex: str, expected: datetime):
+    file_object = fsspec.core.OpenFile(fsspec.filesystem("file"), os.path.join(tmp_path, file_name))
+
+    # Parts of the date which are not captured default to the start of the enclosing period
+    assert date_extractor(file_object, re.compile(filename_regex)) == expected
+
+
+def test_date_extractor_requires_year(tmp_path):
+    file_object = fsspec.core.OpenFile(fsspec.filesystem("file"), os.path.join(tmp_path, "logs_03-14.json"))
+
+    with pytest.raises(ValueError):
+        date_extractor(file_object, re.compile(r"_(?P<month>\d{2})-(?P<day>\d{2})\."))
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# SPDX-FileCopyrightText: Copyright (c) 2023, NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import cupy as cp
+import numpy as np
+import pytest
+
+from morpheus.common import find_detection_ranges
+
+
+def _expected_ranges(probs: np.ndarray, threshold: float) -> np.ndarray:
+    mask = probs > threshold
+
+    if (mask.ndim > 1):
+        mask = mask.any(axis=1)
+
+    edges = np.flatnonzero(np.diff(mask.astype(np.int8), prepend=0, append=0))
+
+    return edges.reshape((-1, 2))
+
+
+def _check_ranges(probs: cp.ndarray, threshold: float):
+    ranges = find_detection_ranges(probs, threshold)
+
+    assert isinstance(ranges, np.ndarray)
+    assert ranges.shape[1] == 2
+    np.testing.assert_array_equal(ranges, _expected_ranges(probs.get(), threshold))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("threshold", [0.1, 0.5, 0.9])
+def test_find_detection_ranges_1d(dtype: np.dtype, threshold: float):
+    probs = cp.random.default_rng(1).random(100, dtype=dtype)
+
+    _check_ranges(probs, threshold)
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("threshold", [0.5, 0.9, 0.99])
+def test_find_detection_ranges_2d(dtype: np.dtype, order: str, threshold: float):
+    probs = cp.asarray(cp.random.default_rng(2).random((100, 3), dtype=dtype), order=order)
+
+    _check_ranges(probs, threshold)
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_find_detection_ranges_offset(order: str):
+    probs = cp.asarray(cp.random.default_rng(3).random((100, 3), dtype=np.float32), order=order)
+
+    # Slices start at an offset into the buffer and may not be contiguous
+    _check_ranges(probs[10:70], 0.9)
+    _check_ranges(probs[10:70, 1], 0.5)
+    _check_ranges(probs[10:70:2], 0.9)
+
+
+def test_find_detection_ranges_empty():
+    probs = cp.zeros((10, 3), dtype=np.float32)
+
+    ranges = find_detection_ranges(probs, 0.5)
+
+    assert ranges.shape == (0, 2)
+
+    # Every row above the threshold is a single range
+    np.testing.assert_array_equal(find_detection_ranges(probs + 1, 0.5), [[0, 10]])
+
+
+class _ArrayInterfaceV2:
+    """
+    Exposes a CuPy array through version 2 of the CUDA array interface, which does not include the stream.
+    """
+
+    def __init__(self, array: cp.ndarray):
+        self._array = array
+
+        interface = dict(array.__cuda_array_interface__)
+        interface.pop("stream", None)
+        interface["version"] = 2
+
+        self.__cuda_array_interface__ = interface
+
+
+def test_find_detection_ranges_interface_v2():
+    probs = cp.random.default_rng(4).random((100, 3), dtype=np.float32)
+
+    ranges = find_detection_ranges(_ArrayInterfaceV2(probs), 0.9)
+
+    np.testing.assert_array_equal(ranges, _expected_ranges(probs.get(), 0.9))
@@ -298,6 +298,40 @@ def test_copy_ranges_dup_index(filter_probs_df: cudf.DataFrame):
     test_copy_ranges(df)
 
 
+@pytest.mark.use_python
+@pytest.mark.parametrize("ranges_type", [list, np.array, cp.array])
+def test_copy_ranges_array(filter_probs_df: cudf.DataFrame, ranges_type: typing.Callable):
+
+    meta = MessageMeta(filter_probs_df)
+
+    mm = MultiMessage(meta=meta)
+
+    # Adjacent and overlapping ranges
+    ranges = [(2, 6), (6, 8), (12, 15), (13, 14)]
+    mm2 = mm.copy_ranges(ranges_type(ranges))
+    assert mm2.mess_count == (8 - 2) + (15 - 12)
+    assert assert_df_equal(mm2.get_meta(), mm.copy_ranges([(2, 8), (12, 15)]).get_meta())
+
+
+@pytest.mark.use_python
+def test_copy_rows(filter_probs_df: cudf.DataFrame):
+
+    meta = MessageMeta(filter_probs_df)
+
+    mm = MultiMessage(meta=meta)
+
+    mask = cp.zeros(len(filter_probs_df), dtype=bool)
+    mask[2:6] = True
+    mask[12:15] = True
+
+    mm2 = mm.copy_rows(mask)
+    assert mm2.meta is not meta
+    assert mm2.meta.count == 7
+    assert mm2.mess_offset == 0
+    assert mm2.mess_count == 7
+    assert assert_df_equal(mm2.get_meta(), mm.copy_ranges([(2, 6), (12, 15)]).get_meta())
+
+
 def test_get_slice_ranges(filter_probs_df: cudf.DataFrame):
 
     meta = MessageMeta(filter_probs_df)
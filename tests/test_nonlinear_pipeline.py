@@ -51,15 +51,28 @@ class SplitStage(Stage):
 
         assert len(in_ports_streams) == 1, "Only 1 input supported"
 
+        # Compute the mask once for both outputs, reading the DataFrame in place rather than through the copying `df`
+        # property
+        def compute_mask_fn(data: MessageMeta) -> typing.Tuple[MessageMeta, cudf.Series]:
+            with data.mutable_dataframe() as df:
+                return (data, df["v2"] >= 0.5)
+
+        compute_mask = builder.make_node("compute_mask", ops.map(compute_mask_fn))
+        builder.make_edge(in_ports_streams[0][0], compute_mask)
+
         # Create a broadcast node
         broadcast = Broadcast(builder, "broadcast")
-        builder.make_edge(in_ports_streams[0][0], broadcast)
+        builder.make_edge(compute_mask, broadcast)
 
-        def filter_higher_fn(data: MessageMeta):
-            return MessageMeta(data.df[data.df["v2"] >= 0.5])
+        def filter_higher_fn(data: typing.Tuple[MessageMeta, cudf.Series]):
+            (meta, mask) = data
+            with meta.mutable_dataframe() as df:
+                return MessageMeta(df[mask])
 
-        def filter_lower_fn(data: MessageMeta):
-            return MessageMeta(data.df[data.df["v2"] < 0.5])
+        def filter_lower_fn(data: typing.Tuple[MessageMeta, cudf.Series]):
+            (meta, mask) = data
+            with meta.mutable_dataframe() as df:
+                return MessageMeta(df[~mask])
 
         # Create a node that only passes on rows >= 0.5
         filter_higher = builder.make_node("filter_higher", ops.map(filter_higher_fn))
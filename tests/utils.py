@@ -21,6 +21,7 @@ import time
 import typing
 
 import cupy as cp
+import mrc
 import pandas as pd
 
 import cudf
@@ -218,3 +219,40 @@ def assert_results(results: dict) -> dict:
     assert results["diff_cols"] == 0, f"Expected diff_cols=0 : {results}"
     assert results["diff_rows"] == 0, f"Expected diff_rows=0 : {results}"
     return results
+
+
+def run_module(module_id: str, module_config: dict, messages: typing.List[typing.Any]) -> typing.List[typing.Any]:
+    """
+    Runs the Morpheus module `module_id` in a single segment pipeline, emitting each of `messages` into its input port.
+    Returns the messages received from its output port.
+    """
+    results = []
+    errors = []
+
+    def init_wrapper(builder: mrc.Builder):
+
+        def gen_data():
+            yield from messages
+
+        source = builder.make_source("source", gen_data)
+        module = builder.load_module(module_id, "morpheus", "module_under_test", module_config)
+        sink = builder.make_sink("sink", results.append, errors.append, lambda: None)
+
+        builder.make_edge(source, module.input_port("input"))
+        builder.make_edge(module.output_port("output"), sink)
+
+    pipeline = mrc.Pipeline()
+    pipeline.make_segment("main", init_wrapper)
+
+    options = mrc.Options()
+    options.topology.user_cpuset = "0-1"
+
+    executor = mrc.Executor(options)
+    executor.register_pipeline(pipeline)
+    executor.start()
+    executor.join()
+
+    if (len(errors) > 0):
+        raise errors[0]
+
+    return results